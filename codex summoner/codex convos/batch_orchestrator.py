@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Batch Codex Conversations - Runs many independent conversations for sweeps and evaluations.
+
+Conversations advance together one round at a time: every conversation's prompt for
+the current round is sent at once, bounded by a concurrency limit and a per-minute
+rate limit, and the next round starts when all of them have answered. This suits a
+personality x prompt matrix, where running conversations one after another would
+leave codex idle most of the time.
+
+Usage: python batch_orchestrator.py <prompts_file> [rounds] [max_concurrency]
+  prompts_file - Text file with one initial prompt per line (one conversation each)
+"""
+
+import asyncio
+import sys
+import os
+import time
+from typing import Callable, List, Optional
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    # Fall back to evenly spacing calls if aiolimiter is not installed
+    AsyncLimiter = None
+
+# Add the current directory to the path so we can import the orchestrator
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conversation_orchestrator import CodexInstance, ConversationOrchestrator
+from llm_cache import LLMCache
+
+
+class _IntervalLimiter:
+    """
+    Minimal stand-in for aiolimiter.AsyncLimiter that spaces calls evenly over the period.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60):
+        if max_rate <= 0:
+            raise ValueError("max_rate must be greater than 0")
+        self.interval = time_period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class BatchOrchestrator:
+    """
+    Runs several conversations concurrently under a shared concurrency and rate limit.
+    """
+    
+    def __init__(self, max_concurrency: int = 10, rate_limit_per_min: float = 100,
+                 progress_callback: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize the batch orchestrator.
+        
+        Args:
+            max_concurrency (int): Maximum number of codex calls in flight at once
+            rate_limit_per_min (float): Maximum number of codex calls started per minute
+            progress_callback (Callable): Called as progress_callback(completed, total) after
+                each codex call finishes
+        """
+        if rate_limit_per_min <= 0:
+            raise ValueError("rate_limit_per_min must be greater than 0")
+        self.max_concurrency = max_concurrency
+        self.rate_limit_per_min = rate_limit_per_min
+        self.progress_callback = progress_callback
+        self.completed = 0
+        self.total = 0
+    
+    async def run(self, orchestrators: List[ConversationOrchestrator], initial_prompts: List[str],
+                  rounds: int = 5) -> None:
+        """
+        Run every conversation for the given number of rounds and save each one.
+        
+        Each call is a one-shot codex process rather than a persistent worker, so the
+        number of codex processes stays within max_concurrency however many
+        conversations are in the batch.
+        
+        Args:
+            orchestrators (List[ConversationOrchestrator]): Conversations to run
+            initial_prompts (List[str]): Initial prompt for each conversation, in the same order
+            rounds (int): Number of rounds for every conversation
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        if AsyncLimiter is not None:
+            limiter = AsyncLimiter(self.rate_limit_per_min, 60)
+        else:
+            limiter = _IntervalLimiter(self.rate_limit_per_min, 60)
+        
+        self.completed = 0
+        self.total = len(orchestrators) * rounds
+        
+        async def send(instance: CodexInstance, prompt: str) -> str:
+            async with semaphore:
+                async with limiter:
+                    response = await instance.send_prompt(prompt)
+            self.completed += 1
+            if self.progress_callback is not None:
+                self.progress_callback(self.completed, self.total)
+            return response
+        
+        prompts = list(initial_prompts)
+        for orchestrator in orchestrators:
+            orchestrator.open_log()
+        
+        try:
+            for round_num in range(1, rounds + 1):
+                # Instance1 answers odd rounds and instance2 even rounds, as in start_conversation
+                speakers = [
+                    orchestrator.instance1 if round_num % 2 else orchestrator.instance2
+                    for orchestrator in orchestrators
+                ]
+                responses = await asyncio.gather(*[
+                    send(speaker, prompt) for speaker, prompt in zip(speakers, prompts)
+                ])
+                now = time.time()
+                
+                for index, (orchestrator, speaker, response) in enumerate(zip(orchestrators, speakers, responses)):
+                    prompts[index] = orchestrator.record_round(round_num, speaker, prompts[index], response, now)
+        finally:
+            for orchestrator in orchestrators:
+                orchestrator.close_log()
+                orchestrator.save_conversation()
+
+
+def main():
+    """
+    Main function to run a batch of conversations from a prompts file.
+    """
+    if len(sys.argv) < 2:
+        print("Usage: python batch_orchestrator.py <prompts_file> [rounds] [max_concurrency]")
+        print("\nExample: python batch_orchestrator.py prompts.txt 3 10")
+        sys.exit(1)
+    
+    with open(sys.argv[1]) as f:
+        initial_prompts = [line.strip() for line in f if line.strip()]
+    if not initial_prompts:
+        print("No prompts found. Exiting.")
+        sys.exit(1)
+    
+    rounds = int(sys.argv[2]) if len(sys.argv) >= 3 and sys.argv[2].isdigit() else 5
+    max_concurrency = int(sys.argv[3]) if len(sys.argv) >= 4 and sys.argv[3].isdigit() else 10
+    
+    # One response cache for the whole batch, so repeated prompts across conversations hit it
+    cache = LLMCache(
+        directory=os.path.join("conversations", ".cache"),
+        embedding_model_dir=os.environ.get("CODEX_EMBEDDING_MODEL_DIR")
+    )
+    
+    orchestrators = []
+    for index in range(len(initial_prompts)):
+        instance1 = CodexInstance(
+            name="Codex Alpha",
+            personality="You are a creative and innovative AI assistant. Focus on generating new ideas and thinking outside the box."
+        )
+        instance2 = CodexInstance(
+            name="Codex Beta",
+            personality="You are a practical and analytical AI assistant. Focus on refining ideas and providing detailed implementation suggestions."
+        )
+        orchestrators.append(ConversationOrchestrator(f"Batch_{index + 1}", instance1, instance2, cache=cache))
+    
+    def report(completed: int, total: int) -> None:
+        print(f"Progress: {completed}/{total} responses", flush=True)
+    
+    batch = BatchOrchestrator(max_concurrency=max_concurrency, progress_callback=report)
+    
+    print(f"Running {len(orchestrators)} conversations for {rounds} rounds")
+    print("=" * 60)
+    
+    try:
+        asyncio.run(batch.run(orchestrators, initial_prompts, rounds))
+    except KeyboardInterrupt:
+        print("\n\nBatch interrupted by user. Partial conversations were saved.")
+    
+    for orchestrator in orchestrators:
+        print(f"Saved: {orchestrator.get_conversation_filename()}")
+
+
+if __name__ == "__main__":
+    main()
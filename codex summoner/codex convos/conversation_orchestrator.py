@@ -11,15 +11,95 @@ This script creates two separate codex instances that can iterate on a project b
 Usage: python conversation_orchestrator.py [project_name] [initial_prompt] [rounds]
 """
 
-import subprocess
+import asyncio
+import difflib
 import sys
-import shlex
 import json
 import re
 import os
 import time
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, AsyncIterator
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder if orjson is not installed
+    orjson = None
+
+from llm_cache import LLMCache
+
+# codex_utils lives in the parent codex summoner directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codex_utils import parse_codex_output, aiter_codex_output, build_codex_argv
+
+# Characters not allowed in conversation filenames
+_SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Max bytes per line read from codex; a single JSON message can exceed asyncio's 64 KiB default
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+def _truncate(text: str, max_chars: Optional[int]) -> str:
+    """
+    Shorten text to at most max_chars by keeping its head and tail around an ellipsis marker.
+    
+    Args:
+        text (str): Text to shorten
+        max_chars (int): Maximum length (None or 0 disables truncation)
+        
+    Returns:
+        str: The original text if short enough, otherwise head + marker + tail
+    """
+    if not max_chars or len(text) <= max_chars:
+        return text
+    
+    marker = "\n\n[... truncated ...]\n\n"
+    keep = max(max_chars - len(marker), 0)
+    head = keep // 2
+    tail = keep - head
+    return text[:head] + marker + (text[-tail:] if tail else "")
+
+
+def _worker_event(line: str) -> Optional[str]:
+    """
+    Return the type of a codex worker control line such as {"type": "turn_end"}.
+    
+    Args:
+        line (str): A single line of worker output
+        
+    Returns:
+        str: The line's "type" field, or None for a line that isn't a JSON object
+    """
+    line = line.strip()
+    if not line.startswith('{'):
+        return None
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    return data.get('type') if isinstance(data, dict) else None
+
+
+def _similar_enough(a: str, b: str, threshold: float) -> bool:
+    """
+    Check whether two texts have a similarity ratio of at least threshold.
+    
+    The cheap upper bounds are checked first, so clear mismatches skip the full ratio.
+    """
+    matcher = difflib.SequenceMatcher(None, a, b)
+    return (matcher.real_quick_ratio() >= threshold and
+            matcher.quick_ratio() >= threshold and
+            matcher.ratio() >= threshold)
+
+
+class CodexError(Exception):
+    """
+    Raised when a codex call fails; the message is the error text shown to the user.
+    """
 
 
 class CodexInstance:
@@ -27,70 +107,301 @@ class CodexInstance:
     Represents a single codex instance that can send prompts and receive responses.
     """
     
-    def __init__(self, name: str, personality: str = ""):
+    # Long-lived codex worker that reads newline-delimited JSON prompts on stdin
+    WORKER_COMMAND = ["codex", "--full-auto", "-q", "-m", "o3", "--stdin"]
+    MODEL = "o3"
+    
+    # Control lines the worker prints, as {"type": ...}: once when it is ready for
+    # prompts, and after the last output of each reply
+    WORKER_READY = "ready"
+    WORKER_TURN_END = "turn_end"
+    WORKER_HANDSHAKE_TIMEOUT = 10
+    
+    def __init__(self, name: str, personality: str = "", cache: Optional[LLMCache] = None,
+                 history_size: int = 64, use_worker: bool = False):
         """
         Initialize a codex instance with a name and optional personality.
         
         Args:
             name (str): Name/identifier for this instance
             personality (str): Optional personality prompt to prepend to all messages
+            cache (LLMCache): Optional response cache checked before running codex
+            history_size (int): Number of recent exchanges kept in conversation_history
+            use_worker (bool): Keep a persistent codex worker instead of running codex per
+                prompt (requires a codex build that speaks the stdin worker protocol)
         """
         self.name = name
         self.personality = personality
-        self.conversation_history = []  # Track conversation history for this instance
+        self.cache = cache
+        self.use_worker = use_worker
+        # Recent exchanges for this instance; the orchestrator's conversation_log is the full record
+        self.conversation_history = deque(maxlen=history_size)
+        
+        # Persistent worker process (only set while used as an async context manager)
+        self.proc = None
+        self.stdin = None
+        self.stdout = None
+        self._worker_lock = None
+    
+    async def __aenter__(self):
+        await self.start_worker()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop_worker()
+        return False
+    
+    async def start_worker(self) -> bool:
+        """
+        Start a persistent codex worker so each prompt avoids a fresh fork/exec.
+        
+        Returns:
+            bool: True if the worker is running, False if the one-shot path will be used
+        """
+        if not self.use_worker:
+            return False
+        if self.proc is not None and self.proc.returncode is None:
+            return True
+        
+        try:
+            self.proc = await asyncio.create_subprocess_exec(
+                *self.WORKER_COMMAND,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=STREAM_LIMIT
+            )
+        except OSError:
+            self.proc = None
+            return False
+        
+        # Wait for the worker to announce it is ready. A codex build without the stdin
+        # protocol exits, prints something else, or sits waiting for input instead
+        try:
+            line = await asyncio.wait_for(self.proc.stdout.readline(), timeout=self.WORKER_HANDSHAKE_TIMEOUT)
+        except (asyncio.TimeoutError, ValueError):
+            line = b""
+        
+        if _worker_event(line.decode(errors="replace")) != self.WORKER_READY:
+            proc, self.proc = self.proc, None
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            return False
+        
+        self.stdin = self.proc.stdin
+        self.stdout = self.proc.stdout
+        self._worker_lock = asyncio.Lock()
+        return True
+    
+    async def stop_worker(self) -> None:
+        """
+        Shut down the persistent codex worker if one is running.
+        """
+        if self.proc is None:
+            return
+        
+        proc = self.proc
+        self.proc = None
+        self.stdin = None
+        self.stdout = None
+        
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError):
+            proc.kill()
+            await proc.wait()
     
-    def send_prompt(self, prompt: str) -> str:
+    async def send_prompt(self, prompt: str, one_shot: bool = False) -> str:
         """
         Send a prompt to this codex instance and return the response.
         
         Args:
             prompt (str): The prompt to send
+            one_shot (bool): Run a separate codex process even if a worker is running
             
         Returns:
-            str: The response from the codex instance
+            str: The response from the codex instance (or an error message)
         """
-        # Construct the full prompt with personality if specified
-        full_prompt = prompt
-        if self.personality:
-            full_prompt = f"{self.personality}\n\n{prompt}"
+        try:
+            return '\n'.join([fragment async for fragment in self.send_prompt_stream(prompt, one_shot)])
+        except CodexError as e:
+            # Any fragments that arrived before the failure are dropped with it
+            return str(e)
+    
+    async def send_prompt_stream(self, prompt: str, one_shot: bool = False) -> AsyncIterator[str]:
+        """
+        Send a prompt and yield response fragments as codex produces them.
+        
+        Args:
+            prompt (str): The prompt to send
+            one_shot (bool): Run a separate codex process even if a worker is running,
+                e.g. for a call that may be cancelled midway
+            
+        Yields:
+            str: Clean text fragments
+            
+        Raises:
+            CodexError: If codex can't be run, fails or times out, possibly after some
+                fragments were already yielded; a failed response is never cached
+        """
+        cached = await self._get_cached(prompt)
+        if cached is not None:
+            yield cached
+            return
+        
+        full_prompt = self._build_full_prompt(prompt)
+        
+        # Prefer the persistent worker; fall back to one-shot if it is unavailable
+        if self.proc is not None and not one_shot:
+            try:
+                clean_output = await self._send_via_worker(full_prompt)
+            except (OSError, EOFError, ValueError, asyncio.TimeoutError):
+                await self.stop_worker()
+            else:
+                await self._store_response(prompt, clean_output)
+                yield clean_output
+                return
         
         # Execute the codex command using the same format as the original codex.py
-        command = f'codex --full-auto -q -m o3 "{full_prompt}"'
+        argv = build_codex_argv(self.MODEL, full_prompt)
         
         try:
-            # Execute the command using subprocess
-            result = subprocess.run(
-                shlex.split(command),  # Split command safely for shell execution
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout for longer conversations
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT
             )
-            
-            # Check if command executed successfully
-            if result.returncode == 0:
-                # Parse the output to extract clean text
-                raw_output = result.stdout.strip()
-                clean_output = self._parse_codex_output(raw_output)
-                
-                # Add to conversation history
-                self.conversation_history.append({
-                    'prompt': prompt,
-                    'response': clean_output,
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                return clean_output
-            else:
-                # If command failed, return the error message
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error occurred"
-                return f"Error: {error_msg}"
-                
-        except subprocess.TimeoutExpired:
-            return "Error: Command timed out after 120 seconds"
         except FileNotFoundError:
-            return "Error: 'codex' command not found. Please ensure codex is installed and in your PATH."
+            raise CodexError("Error: 'codex' command not found. Please ensure codex is installed and in your PATH.")
         except Exception as e:
-            return f"Error executing command: {str(e)}"
+            raise CodexError(f"Error executing command: {str(e)}")
+        
+        # Drain stderr concurrently so a chatty codex can't fill the pipe and stall stdout
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+        
+        # 2 minute timeout for longer conversations
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 120
+        
+        async def read_lines():
+            while True:
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout=max(0, deadline - loop.time()))
+                if not line:
+                    return
+                yield line.decode()
+        
+        fragments = []
+        timed_out = False
+        try:
+            async for fragment in aiter_codex_output(read_lines()):
+                fragments.append(fragment)
+                yield fragment
+            await asyncio.wait_for(proc.wait(), timeout=max(0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            # Also reached on cancellation: don't leave an orphaned codex process behind
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr = (await stderr_task).decode()
+        
+        if timed_out:
+            raise CodexError("Error: Command timed out after 120 seconds")
+        if proc.returncode != 0:
+            raise CodexError(f"Error: {stderr.strip() or 'Unknown error occurred'}")
+        await self._store_response(prompt, '\n'.join(fragments))
+    
+    def _build_full_prompt(self, prompt: str) -> str:
+        """
+        Construct the full prompt with personality if specified.
+        """
+        if self.personality:
+            return f"{self.personality}\n\n{prompt}"
+        return prompt
+    
+    async def _send_via_worker(self, full_prompt: str) -> str:
+        """
+        Send a prompt over the persistent worker's stdio and wait for the completed reply.
+        
+        Args:
+            full_prompt (str): The prompt including any personality prefix
+            
+        Returns:
+            str: Clean text response
+        """
+        # One request in flight per worker
+        async with self._worker_lock:
+            if self.proc is None:
+                raise EOFError("codex worker was stopped")
+            
+            try:
+                self.stdin.write((json.dumps({"prompt": full_prompt}) + "\n").encode())
+                await self.stdin.drain()
+                
+                # Read until the worker's end-of-turn line; a full-auto turn can include
+                # several completed assistant messages before it
+                lines = []
+                while True:
+                    line = (await asyncio.wait_for(self.stdout.readline(), timeout=120)).decode()
+                    if not line:
+                        raise EOFError("codex worker exited mid-response")
+                    if _worker_event(line) == self.WORKER_TURN_END:
+                        break
+                    lines.append(line)
+            except asyncio.CancelledError:
+                # The rest of this reply is still coming, and the next prompt would read it
+                # as its own, so the worker can't be reused
+                await self.stop_worker()
+                raise
+        
+        return self._parse_codex_output(''.join(lines).strip())
+    
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Build the response cache key for a prompt sent by this instance.
+        """
+        return LLMCache.make_key(self.MODEL, self.personality, prompt)
+    
+    def _cache_namespace(self) -> str:
+        """
+        Build the semantic cache namespace for this instance's model and personality.
+        """
+        return LLMCache.make_namespace(self.MODEL, self.personality)
+    
+    async def _get_cached(self, prompt: str) -> Optional[str]:
+        """
+        Return a cached response for the prompt, recording it in history on a hit.
+        """
+        if self.cache is None:
+            return None
+        
+        response = await self.cache.aget(self._cache_key(prompt), prompt=prompt, namespace=self._cache_namespace())
+        if response is not None:
+            self._add_to_history(prompt, response)
+        return response
+    
+    async def _store_response(self, prompt: str, response: str) -> None:
+        """
+        Record a fresh codex response in history and in the cache.
+        """
+        self._add_to_history(prompt, response)
+        if self.cache is not None:
+            await self.cache.aset(self._cache_key(prompt), response, prompt=prompt, namespace=self._cache_namespace())
+    
+    def _add_to_history(self, prompt: str, response: str) -> None:
+        """
+        Record a completed exchange in this instance's conversation history.
+        """
+        self.conversation_history.append({
+            'prompt': prompt,
+            'response': response,
+            'timestamp': datetime.now().isoformat()
+        })
     
     def _parse_codex_output(self, raw_output: str) -> str:
         """
@@ -102,42 +413,18 @@ class CodexInstance:
         Returns:
             str: Clean text response without JSON metadata
         """
-        lines = raw_output.strip().split('\n')
-        clean_responses = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            try:
-                # Try to parse as JSON
-                data = json.loads(line)
-                
-                # Look for assistant message with output_text content
-                if (data.get('type') == 'message' and 
-                    data.get('role') == 'assistant' and 
-                    data.get('status') == 'completed' and
-                    'content' in data):
-                    
-                    for content_item in data['content']:
-                        if (isinstance(content_item, dict) and 
-                            content_item.get('type') == 'output_text' and
-                            'text' in content_item):
-                            clean_responses.append(content_item['text'].strip())
-                            
-            except json.JSONDecodeError:
-                # If it's not JSON, it might be plain text output
-                # Only include if it doesn't look like JSON
-                if not line.startswith('{') and not line.startswith('['):
-                    clean_responses.append(line)
-        
-        # Join all clean responses
-        if clean_responses:
-            return '\n'.join(clean_responses)
-        else:
-            # If no clean responses found, return the original output
-            return raw_output
+        return parse_codex_output(raw_output)
+
+
+@lru_cache(maxsize=None)
+def _default_cache(directory: str, embedding_model_dir: Optional[str]) -> LLMCache:
+    """
+    Return the default response cache for a directory, shared by every orchestrator using it.
+    
+    One instance per directory means the embedding model is loaded once and appends to the
+    semantic files all go through the same lock (e.g. for the conversations run_many starts).
+    """
+    return LLMCache(directory=directory, embedding_model_dir=embedding_model_dir)
 
 
 class ConversationOrchestrator:
@@ -145,7 +432,9 @@ class ConversationOrchestrator:
     Manages a conversation between two codex instances.
     """
     
-    def __init__(self, project_name: str, instance1: CodexInstance, instance2: CodexInstance):
+    def __init__(self, project_name: str, instance1: CodexInstance, instance2: CodexInstance,
+                 cache: Optional[LLMCache] = None, use_cache: bool = True,
+                 max_prompt_chars: Optional[int] = 8000):
         """
         Initialize the conversation orchestrator.
         
@@ -153,103 +442,302 @@ class ConversationOrchestrator:
             project_name (str): Name of the project for file naming
             instance1 (CodexInstance): First codex instance
             instance2 (CodexInstance): Second codex instance
+            cache (LLMCache): Response cache shared by both instances (defaults to conversations/.cache,
+                with the semantic tier enabled when CODEX_EMBEDDING_MODEL_DIR points at an ONNX export)
+            use_cache (bool): Set to False to always call codex
+            max_prompt_chars (int): Cap on the response fed back as the next prompt (None to disable)
         """
         self.project_name = project_name
         self.instance1 = instance1
         self.instance2 = instance2
         self.conversation_log = []
+        self.speculation_stats = {'hits': 0, 'misses': 0}
+        self.max_prompt_chars = max_prompt_chars
         self.output_dir = "conversations"
+        self.conversation_filename = None  # Fixed per conversation so the .md and .jsonl names match
+        self._log_file = None  # Per-round .jsonl sidecar, open while a conversation runs
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Share one response cache across instances (and across runs when diskcache is installed)
+        if use_cache:
+            if cache is None:
+                cache = _default_cache(os.path.join(self.output_dir, ".cache"),
+                                       os.environ.get("CODEX_EMBEDDING_MODEL_DIR"))
+            for instance in (instance1, instance2):
+                if instance.cache is None:
+                    instance.cache = cache
     
-    def start_conversation(self, initial_prompt: str, rounds: int = 5) -> None:
+    async def start_conversation(self, initial_prompt: str, rounds: int = 5, speculate: bool = False,
+                                 speculation_threshold: float = 0.8) -> None:
         """
         Start a conversation between the two instances.
         
+        Turn order stays sequential (A, B, A, B, ...); waits on codex and the pauses
+        between rounds yield to the event loop, so several conversations can overlap
+        (see run_many).
+        
+        With speculate=True, the responding instance is sent a hint prompt (the prompt
+        the current instance is answering) on a separate one-shot codex process while
+        the current call is still in flight. If the prompt the responding instance would
+        actually receive turns out similar enough to the hint, the next round is the
+        speculative exchange: it is logged as the hint and its answer, and the
+        conversation continues from that answer with its latency hidden. Otherwise the
+        speculative call is cancelled. This only pays off when responses tend to restate
+        their prompt; a miss costs an extra codex call. Hit/miss counts are kept in
+        self.speculation_stats.
+        
         Args:
             initial_prompt (str): The initial prompt to start the conversation
             rounds (int): Number of back-and-forth rounds to conduct
+            speculate (bool): Pre-issue the next round's call speculatively
+            speculation_threshold (float): Minimum similarity (0-1) for a speculative answer to be kept
         """
-        print(f"Starting conversation on project: {self.project_name}")
-        print(f"Initial prompt: {initial_prompt}")
-        print(f"Rounds: {rounds}")
-        print("=" * 60)
+        self._print_header(initial_prompt, rounds)
+        
+        self.open_log()
+        try:
+            # Keep one codex worker per instance alive for the whole conversation (when
+            # enabled), starting both at once so their handshakes overlap
+            await asyncio.gather(self.instance1.start_worker(), self.instance2.start_worker())
+            try:
+                await self._run_rounds(initial_prompt, rounds, speculate, speculation_threshold)
+            finally:
+                await asyncio.gather(self.instance1.stop_worker(), self.instance2.stop_worker())
+        finally:
+            self.close_log()
+        
+        # Save the conversation
+        self.save_conversation()
         
+        if speculate:
+            print(f"Speculation hits: {self.speculation_stats['hits']}, misses: {self.speculation_stats['misses']}")
+        print(f"\nConversation completed! Saved to: {self.get_conversation_filename()}")
+    
+    async def _run_rounds(self, initial_prompt: str, rounds: int, speculate: bool,
+                          speculation_threshold: float) -> None:
+        """
+        Run the back-and-forth rounds, alternating between the two instances.
+        """
         # Start with instance1 responding to the initial prompt
         current_prompt = initial_prompt
         current_instance = self.instance1
         responding_instance = self.instance2
         
-        for round_num in range(1, rounds + 1):
-            print(f"\n--- Round {round_num} ---")
-            print(f"{current_instance.name} is responding...")
-            
-            # Get response from current instance
-            response = current_instance.send_prompt(current_prompt)
-            
-            print(f"\n{current_instance.name}'s response:")
-            print("-" * 40)
-            print(response)
-            print("-" * 40)
-            
-            # Log this exchange
-            self.conversation_log.append({
-                'round': round_num,
-                'speaker': current_instance.name,
-                'prompt': current_prompt,
-                'response': response,
-                'timestamp': datetime.now().isoformat()
-            })
-            
-            # Switch instances for next round
-            current_prompt = response
-            current_instance, responding_instance = responding_instance, current_instance
+        # Speculative call used as the next round once it has matched, as (hint prompt, task)
+        prefetched = None
+        speculative = None
+        
+        try:
+            for round_num in range(1, rounds + 1):
+                print(f"\n--- Round {round_num} ---")
+                print(f"{current_instance.name} is responding...")
+                
+                if prefetched is not None:
+                    # The hint is close enough to current_prompt; log the exchange as it happened
+                    sent_prompt, prefetched_task = prefetched
+                    prefetched = None
+                else:
+                    sent_prompt, prefetched_task = current_prompt, None
+                
+                # Start the responding instance's turn on a guess while this one is in flight.
+                # It runs outside the worker, since cancelling a worker call mid-reply would
+                # leave the rest of that reply in the worker's output. A round that is itself
+                # a speculative hit already repeats the previous prompt, so it doesn't
+                # speculate again and the next round moves on to its answer
+                if speculate and round_num < rounds and prefetched_task is None:
+                    speculative = (sent_prompt, asyncio.create_task(
+                        responding_instance.send_prompt(sent_prompt, one_shot=True)
+                    ))
+                
+                print(f"\n{current_instance.name}'s response:")
+                print("-" * 40)
+                
+                if prefetched_task is not None:
+                    response = await prefetched_task
+                    print(response)
+                else:
+                    # Print fragments from the current instance as they arrive
+                    fragments = []
+                    try:
+                        async for fragment in current_instance.send_prompt_stream(sent_prompt):
+                            print(fragment, flush=True)
+                            fragments.append(fragment)
+                        response = '\n'.join(fragments)
+                    except CodexError as e:
+                        # Log the failure on its own rather than as the end of a partial answer
+                        response = str(e)
+                        print(response)
+                now = time.time()
+                
+                print("-" * 40)
+                
+                # Switch instances for next round
+                current_prompt = self.record_round(round_num, current_instance, sent_prompt, response, now)
+                
+                if speculative is not None:
+                    hint_prompt, task = speculative
+                    speculative = None
+                    # Compare against the prompt that would actually be sent next, off the
+                    # event loop since SequenceMatcher is quadratic in the worst case
+                    if await asyncio.to_thread(_similar_enough, hint_prompt, current_prompt,
+                                               speculation_threshold):
+                        self.speculation_stats['hits'] += 1
+                        prefetched = (hint_prompt, task)
+                    else:
+                        self.speculation_stats['misses'] += 1
+                        task.cancel()
+                
+                current_instance, responding_instance = responding_instance, current_instance
+                
+                # Add a small delay between rounds to avoid overwhelming the API,
+                # without blocking other conversations on the event loop
+                if round_num < rounds:
+                    print("\nWaiting 3 seconds before next round...")
+                    await asyncio.sleep(3)
+        finally:
+            # Cancel any speculative call still outstanding (e.g. on interrupt)
+            for pending in (speculative, prefetched):
+                if pending is not None:
+                    pending[1].cancel()
+    
+    def _print_header(self, initial_prompt: str, rounds: int) -> None:
+        """
+        Print the conversation banner.
+        """
+        print(f"Starting conversation on project: {self.project_name}")
+        print(f"Initial prompt: {initial_prompt}")
+        print(f"Rounds: {rounds}")
+        print("=" * 60)
+    
+    def open_log(self) -> None:
+        """
+        Open the .jsonl sidecar that each exchange is appended to as it happens,
+        so a crash loses at most one round.
+        
+        Called at the start of each conversation, which gets its own .md/.jsonl name.
+        """
+        self.conversation_filename = None
+        sidecar = os.path.splitext(self.get_conversation_filename())[0] + ".jsonl"
+        self._log_file = open(sidecar, 'a')
+    
+    def close_log(self) -> None:
+        """
+        Close the .jsonl sidecar, if open.
+        """
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+    
+    def record_round(self, round_num: int, instance: CodexInstance, prompt: str, response: str,
+                     now: float) -> str:
+        """
+        Log a completed round and return the prompt for the next one.
+        
+        Args:
+            round_num (int): Round number, starting at 1
+            instance (CodexInstance): Instance that responded
+            prompt (str): Prompt that was sent
+            response (str): Response that came back
+            now (float): time.time() captured when the response arrived
             
-            # Add a small delay between rounds to avoid overwhelming the API
-            if round_num < rounds:
-                print("\nWaiting 3 seconds before next round...")
-                time.sleep(3)
+        Returns:
+            str: The response capped at max_prompt_chars, so per-round latency doesn't
+                grow with response length
+        """
+        exchange = {
+            'round': round_num,
+            'speaker': instance.name,
+            'prompt': prompt,
+            'response': response,
+            'timestamp': datetime.fromtimestamp(now).isoformat()
+        }
         
-        # Save the conversation
-        self.save_conversation()
+        # Log this exchange
+        self.conversation_log.append(exchange)
         
-        print(f"\nConversation completed! Saved to: {self.get_conversation_filename()}")
+        if self._log_file is not None:
+            line = orjson.dumps(exchange).decode() if orjson is not None else json.dumps(exchange)
+            self._log_file.write(line + "\n")
+            self._log_file.flush()
+        
+        return _truncate(response, self.max_prompt_chars)
     
     def save_conversation(self) -> None:
         """
         Save the conversation to a file in markdown format.
+        
+        Renders the in-memory log; the .jsonl sidecar written during the conversation
+        holds the same exchanges if the process dies before this runs.
         """
         filename = self.get_conversation_filename()
         
-        with open(filename, 'w') as f:
-            f.write(f"# Codex Conversation: {self.project_name}\n\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Participants:** {self.instance1.name}, {self.instance2.name}\n\n")
-            
-            if self.instance1.personality:
-                f.write(f"**{self.instance1.name} Personality:** {self.instance1.personality}\n\n")
-            if self.instance2.personality:
-                f.write(f"**{self.instance2.name} Personality:** {self.instance2.personality}\n\n")
-            
-            f.write("---\n\n")
-            
-            for exchange in self.conversation_log:
-                f.write(f"## Round {exchange['round']}: {exchange['speaker']}\n\n")
-                f.write(f"**Prompt:**\n{exchange['prompt']}\n\n")
-                f.write(f"**Response:**\n{exchange['response']}\n\n")
-                f.write("---\n\n")
+        # Build the whole document first and write it in one go
+        parts = [
+            f"# Codex Conversation: {self.project_name}\n\n",
+            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Participants:** {self.instance1.name}, {self.instance2.name}\n\n"
+        ]
+        
+        if self.instance1.personality:
+            parts.append(f"**{self.instance1.name} Personality:** {self.instance1.personality}\n\n")
+        if self.instance2.personality:
+            parts.append(f"**{self.instance2.name} Personality:** {self.instance2.personality}\n\n")
+        
+        parts.append("---\n\n")
+        
+        for exchange in self.conversation_log:
+            parts.append(f"## Round {exchange['round']}: {exchange['speaker']}\n\n")
+            parts.append(f"**Prompt:**\n{exchange['prompt']}\n\n")
+            parts.append(f"**Response:**\n{exchange['response']}\n\n")
+            parts.append("---\n\n")
+        
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.writelines(parts)
     
     def get_conversation_filename(self) -> str:
         """
         Generate the filename for the conversation log.
         
+        The name is fixed the first time it is requested in a conversation, so repeated
+        calls (and the .jsonl sidecar) all refer to the same file; open_log clears it
+        for the next conversation.
+        
         Returns:
             str: The filename for the conversation
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_project_name = re.sub(r'[^a-zA-Z0-9_-]', '_', self.project_name)
-        return os.path.join(self.output_dir, f"{safe_project_name}_{timestamp}.md")
+        if self.conversation_filename is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            safe_project_name = _SAFE_NAME_RE.sub('_', self.project_name)
+            base = os.path.join(self.output_dir, f"{safe_project_name}_{timestamp}")
+            
+            # Two conversations started within the same second get distinct names
+            candidate, suffix = base, 2
+            while os.path.exists(candidate + ".md") or os.path.exists(candidate + ".jsonl"):
+                candidate = f"{base}_{suffix}"
+                suffix += 1
+            self.conversation_filename = candidate + ".md"
+        return self.conversation_filename
+
+
+async def run_many(orchestrators: List[ConversationOrchestrator], initial_prompts: List[str],
+                   rounds: int = 5) -> None:
+    """
+    Run several independent conversations concurrently.
+    
+    While one conversation waits on codex, the others keep issuing their turns, so a
+    batch of conversations takes roughly as long as the slowest one.
+    
+    Args:
+        orchestrators (List[ConversationOrchestrator]): Conversations to run
+        initial_prompts (List[str]): Initial prompt for each conversation, in the same order
+        rounds (int): Number of rounds for every conversation
+    """
+    await asyncio.gather(*[
+        orchestrator.start_conversation(initial_prompt, rounds)
+        for orchestrator, initial_prompt in zip(orchestrators, initial_prompts)
+    ])
 
 
 def main():
@@ -299,7 +787,7 @@ def main():
     orchestrator = ConversationOrchestrator(project_name, instance1, instance2)
     
     try:
-        orchestrator.start_conversation(initial_prompt, rounds)
+        asyncio.run(orchestrator.start_conversation(initial_prompt, rounds))
     except KeyboardInterrupt:
         print("\n\nConversation interrupted by user.")
         print("Saving partial conversation...")
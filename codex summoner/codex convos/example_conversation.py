@@ -11,6 +11,7 @@ This script shows how to:
 Usage: python example_conversation.py
 """
 
+import asyncio
 import sys
 import os
 
@@ -70,7 +71,7 @@ def main():
     
     try:
         # Start the conversation
-        orchestrator.start_conversation(initial_prompt, rounds=3)
+        asyncio.run(orchestrator.start_conversation(initial_prompt, rounds=3))
         
         # Get the filename of the saved conversation
         conversation_file = orchestrator.get_conversation_filename()
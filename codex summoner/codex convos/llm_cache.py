@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache - Content-addressed cache for codex responses.
+
+Responses are keyed by a sha256 of (model, personality, prompt), so an identical
+prompt sent to an identically configured instance is answered without running
+codex again. Three tiers are used:
+1. An in-memory LRU for the current process
+2. An optional on-disk store (requires the `diskcache` package) so re-runs benefit
+3. An optional semantic tier (requires `numpy`, `onnxruntime` and `tokenizers`) that
+   returns the response of a near-identical earlier prompt, using cosine similarity
+   of all-MiniLM-L6-v2 embeddings
+
+Usage:
+    cache = LLMCache(directory="conversations/.cache")
+    key = LLMCache.make_key("o3", personality, prompt)
+    response = cache.get(key)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+try:
+    import diskcache
+except ImportError:
+    # Without diskcache the cache only lives for the current process
+    diskcache = None
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; appends are then only serialized within the process
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError:
+    # Without these (or numpy) the semantic tier is disabled and only exact matches are served
+    onnxruntime = None
+    Tokenizer = None
+
+
+class MemoryBackend:
+    """
+    In-memory LRU store with optional per-entry expiry.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the in-memory store.
+        
+        Args:
+            max_entries (int): Maximum number of entries kept before evicting the least recently used
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at or None, value)
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def close(self) -> None:
+        pass
+
+
+class DiskBackend:
+    """
+    Persistent store backed by `diskcache`, shared across runs.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the on-disk store.
+        
+        Args:
+            directory (str): Directory where cache files are kept
+        """
+        self._cache = diskcache.Cache(directory)
+    
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        self._cache.set(key, value, expire=ttl)
+    
+    def close(self) -> None:
+        self._cache.close()
+
+
+class MiniLMEmbedder:
+    """
+    Embeds text with all-MiniLM-L6-v2 exported to ONNX, running on the CPU.
+    """
+    
+    def __init__(self, model_dir: str):
+        """
+        Load the ONNX model and tokenizer.
+        
+        Args:
+            model_dir (str): Directory containing model.onnx and tokenizer.json
+        """
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=256)
+    
+    def __call__(self, text: str) -> "np.ndarray":
+        encoding = self.tokenizer.encode(text)
+        input_ids = np.array([encoding.ids], dtype=np.int64)
+        attention_mask = np.array([encoding.attention_mask], dtype=np.int64)
+        
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        
+        # Mean-pool the token embeddings over the attention mask
+        token_embeddings = self.session.run(None, feeds)[0]
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return pooled[0].astype(np.float32)
+
+
+class EmbeddingBackend:
+    """
+    Semantic store that answers with the response of the most similar cached prompt.
+    
+    Embeddings are kept in one float32 matrix so a lookup is a single matrix-vector
+    product, with rows of other namespaces and expired rows masked out by parallel
+    arrays. On disk each new row is appended to a raw float32 file, next to a JSON
+    lines manifest holding the namespace, response and expiry of each row, so storing
+    a response writes one row rather than the whole cache. Appends hold a file lock,
+    so several processes sharing the directory keep the two files in step. Expired
+    rows are dropped from the files when the store is loaded.
+    
+    get and set may be called from worker threads; the embedding runs outside the
+    store's lock.
+    """
+    
+    def __init__(self, embed: Callable[[str], "np.ndarray"], directory: Optional[str] = None,
+                 threshold: float = 0.92, ttl: Optional[float] = None):
+        """
+        Initialize the semantic store.
+        
+        Args:
+            embed (Callable): Function turning text into a 1-D embedding vector
+            directory (str): Directory for the embeddings and manifest (None keeps them in memory)
+            threshold (float): Minimum cosine similarity for a cached response to be returned
+            ttl (float): Seconds before an entry expires (None keeps entries indefinitely)
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.matrix_path = os.path.join(directory, "embeddings.f32") if directory else None
+        self.manifest_path = os.path.join(directory, "embeddings.jsonl") if directory else None
+        
+        self._matrix = None  # Preallocated rows; only the first len(self._entries) are used
+        self._norms = None
+        self._expires = None  # Expiry time of each row (inf for entries that don't expire)
+        self._namespace_ids = None  # Index into self._namespaces of each row's namespace
+        self._namespaces = {}  # namespace -> id
+        self._entries = []  # [{"namespace": ..., "response": ..., "expires_at": ...}] in row order
+        self._lock = threading.Lock()
+        
+        if self.matrix_path and os.path.exists(self.matrix_path) and os.path.exists(self.manifest_path):
+            self._load()
+    
+    def _load(self) -> None:
+        """
+        Load the unexpired rows from disk and rewrite the files without the expired ones.
+        """
+        with self._file_lock():
+            with open(self.manifest_path) as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            flat = np.fromfile(self.matrix_path, dtype=np.float32)
+        if not entries:
+            return
+        
+        # A row is appended to the matrix before its manifest line, so an interrupted
+        # write can leave at most one extra row, which is ignored
+        dim = entries[0]["dim"]
+        rows = min(len(entries), flat.size // dim)
+        matrix = flat[:rows * dim].reshape(rows, dim)
+        
+        now = time.time()
+        keep = [
+            row for row in range(rows)
+            if entries[row].get("expires_at") is None or entries[row]["expires_at"] > now
+        ]
+        
+        if keep:
+            self._entries = [entries[row] for row in keep]
+            self._matrix = np.ascontiguousarray(matrix[keep])
+            self._norms = np.linalg.norm(self._matrix, axis=1).astype(np.float32)
+            self._expires = np.array(
+                [entry.get("expires_at") or np.inf for entry in self._entries], dtype=np.float64
+            )
+            self._namespace_ids = np.array(
+                [self._namespace_id(entry["namespace"]) for entry in self._entries], dtype=np.int32
+            )
+        
+        if len(keep) < len(entries) or rows * dim < flat.size:
+            self._rewrite()
+    
+    def _namespace_id(self, namespace: str) -> int:
+        """
+        Get the id of a namespace, assigning the next one if it is new.
+        """
+        return self._namespaces.setdefault(namespace, len(self._namespaces))
+    
+    def get(self, namespace: str, text: str) -> Optional[str]:
+        """
+        Return the response of the most similar unexpired prompt in the same namespace.
+        
+        Args:
+            namespace (str): Model/personality namespace the prompt belongs to
+            text (str): The prompt being sent
+            
+        Returns:
+            str: The cached response if similarity reaches the threshold, otherwise None
+        """
+        if namespace not in self._namespaces:
+            # Nothing cached for this model/personality, so skip the embedding entirely
+            return None
+        
+        query = self.embed(text)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return None
+        
+        with self._lock:
+            count = len(self._entries)
+            similarities = np.dot(self._matrix[:count], query) / (self._norms[:count] * query_norm + 1e-12)
+            similarities[self._expires[:count] <= time.time()] = -1.0
+            similarities[self._namespace_ids[:count] != self._namespaces[namespace]] = -1.0
+            
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._entries[best]["response"]
+        return None
+    
+    def set(self, namespace: str, text: str, response: str) -> None:
+        """
+        Add a prompt's embedding and response to the store.
+        
+        Args:
+            namespace (str): Model/personality namespace the prompt belongs to
+            text (str): The prompt that was sent
+            response (str): Clean response text
+        """
+        vector = np.asarray(self.embed(text), dtype=np.float32)
+        expires_at = time.time() + self.ttl if self.ttl else None
+        entry = {"namespace": namespace, "response": response, "expires_at": expires_at,
+                 "dim": int(vector.shape[0])}
+        
+        with self._lock:
+            count = len(self._entries)
+            
+            # Grow capacity geometrically so appends don't copy the whole matrix each time
+            if self._matrix is None:
+                self._matrix = np.zeros((16, vector.shape[0]), dtype=np.float32)
+                self._norms = np.zeros(16, dtype=np.float32)
+                self._expires = np.full(16, np.inf)
+                self._namespace_ids = np.zeros(16, dtype=np.int32)
+            elif count == self._matrix.shape[0]:
+                self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+                self._norms = np.concatenate([self._norms, np.zeros_like(self._norms)])
+                self._expires = np.concatenate([self._expires, np.full_like(self._expires, np.inf)])
+                self._namespace_ids = np.concatenate([self._namespace_ids, np.zeros_like(self._namespace_ids)])
+            
+            self._matrix[count] = vector
+            self._norms[count] = np.linalg.norm(vector)
+            self._expires[count] = expires_at if expires_at is not None else np.inf
+            self._namespace_ids[count] = self._namespace_id(namespace)
+            self._entries.append(entry)
+            
+            self._append(vector, entry)
+    
+    def _file_lock(self):
+        """
+        Open and exclusively lock the lock file next to the embeddings, released on close.
+        """
+        directory = os.path.dirname(self.matrix_path)
+        os.makedirs(directory, exist_ok=True)
+        lock_file = open(os.path.join(directory, "embeddings.lock"), 'a')
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+    
+    def _append(self, vector: "np.ndarray", entry: dict) -> None:
+        """
+        Append one row and its manifest line to the files on disk.
+        """
+        if not self.matrix_path:
+            return
+        
+        # The row and its manifest line go in together, so another writer can't interleave
+        with self._file_lock():
+            with open(self.matrix_path, 'ab') as f:
+                f.write(vector.tobytes())
+            with open(self.manifest_path, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+    
+    def _rewrite(self) -> None:
+        """
+        Rewrite both files from the rows in memory, e.g. after dropping expired rows.
+        """
+        count = len(self._entries)
+        with self._file_lock():
+            with open(self.matrix_path, 'wb') as f:
+                if count:
+                    f.write(self._matrix[:count].tobytes())
+            with open(self.manifest_path, 'w') as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in self._entries)
+    
+    def close(self) -> None:
+        pass
+
+
+class LLMCache:
+    """
+    Response cache with exact-match memory/disk tiers and an optional semantic tier.
+    
+    The semantic tier only makes sense when the model answers deterministically for a
+    given prompt (the o3 default), since a near-identical prompt is assumed to deserve
+    the same answer.
+    """
+    
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[float] = None,
+                 max_entries: int = 1024, embedding_model_dir: Optional[str] = None,
+                 similarity_threshold: float = 0.92):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory (str): Directory for the on-disk tier (skipped if None or diskcache is missing)
+            ttl (float): Seconds before an entry expires (None keeps entries indefinitely)
+            max_entries (int): Size of the in-memory LRU tier
+            embedding_model_dir (str): all-MiniLM-L6-v2 ONNX export enabling the semantic tier
+            similarity_threshold (float): Minimum cosine similarity for a semantic hit
+        """
+        self.ttl = ttl
+        self.memory = MemoryBackend(max_entries)
+        self.disk = DiskBackend(directory) if directory and diskcache is not None else None
+        self.semantic = None
+        if embedding_model_dir and onnxruntime is not None and np is not None:
+            self.semantic = EmbeddingBackend(
+                MiniLMEmbedder(embedding_model_dir),
+                directory=directory,
+                threshold=similarity_threshold,
+                ttl=ttl
+            )
+        self.stats = {'hits': 0, 'semantic_hits': 0, 'misses': 0}
+    
+    @staticmethod
+    def make_key(model: str, personality: str, prompt: str) -> str:
+        """
+        Build the content-addressed key for a request.
+        
+        Args:
+            model (str): Model the prompt is sent to
+            personality (str): Personality prompt of the instance
+            prompt (str): The prompt being sent
+        
+        Returns:
+            str: Hex sha256 digest identifying the request
+        """
+        payload = json.dumps({"model": model, "personality": personality, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    @staticmethod
+    def make_namespace(model: str, personality: str) -> str:
+        """
+        Build the semantic-tier namespace, so only prompts to the same model/personality match.
+        
+        Args:
+            model (str): Model the prompt is sent to
+            personality (str): Personality prompt of the instance
+            
+        Returns:
+            str: Hex sha256 digest identifying the instance configuration
+        """
+        payload = json.dumps({"model": model, "personality": personality}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str, prompt: Optional[str] = None, namespace: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key (str): Key from make_key
+            prompt (str): Prompt text, used by the semantic tier when the exact tiers miss
+            namespace (str): Namespace from make_namespace, required with prompt
+        
+        Returns:
+            str: The cached response, or None on a miss
+        """
+        value = self._get_exact(key)
+        if value is not None:
+            return value
+        
+        if self.semantic is not None and prompt is not None:
+            return self._count_semantic(self.semantic.get(namespace, prompt))
+        
+        self.stats['misses'] += 1
+        return None
+    
+    async def aget(self, key: str, prompt: Optional[str] = None, namespace: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response from async code, like get.
+        
+        The exact tiers are checked directly; the semantic lookup runs the embedding model,
+        so it runs in a worker thread to keep the event loop free.
+        """
+        value = self._get_exact(key)
+        if value is not None:
+            return value
+        
+        if self.semantic is not None and prompt is not None:
+            return self._count_semantic(await asyncio.to_thread(self.semantic.get, namespace, prompt))
+        
+        self.stats['misses'] += 1
+        return None
+    
+    def _get_exact(self, key: str) -> Optional[str]:
+        """
+        Look up a response in the memory and disk tiers, counting a hit if found.
+        """
+        value = self.memory.get(key)
+        
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                # Promote to memory so later hits skip the disk read
+                self.memory.set(key, value, self.ttl)
+        
+        if value is not None:
+            self.stats['hits'] += 1
+        return value
+    
+    def _count_semantic(self, value: Optional[str]) -> Optional[str]:
+        """
+        Count the outcome of a semantic lookup and pass its value through.
+        """
+        self.stats['semantic_hits' if value is not None else 'misses'] += 1
+        return value
+    
+    def set(self, key: str, value: str, prompt: Optional[str] = None, namespace: Optional[str] = None) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key (str): Key from make_key
+            value (str): Clean response text
+            prompt (str): Prompt text, indexed by the semantic tier when given
+            namespace (str): Namespace from make_namespace, required with prompt
+        """
+        self.memory.set(key, value, self.ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, self.ttl)
+        if self.semantic is not None and prompt is not None:
+            self.semantic.set(namespace, prompt, value)
+    
+    async def aset(self, key: str, value: str, prompt: Optional[str] = None, namespace: Optional[str] = None) -> None:
+        """
+        Store a response from async code, like set, embedding the prompt in a worker thread.
+        """
+        self.memory.set(key, value, self.ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, self.ttl)
+        if self.semantic is not None and prompt is not None:
+            await asyncio.to_thread(self.semantic.set, namespace, prompt, value)
+    
+    def close(self) -> None:
+        """
+        Release any open backend resources.
+        """
+        self.memory.close()
+        if self.disk is not None:
+            self.disk.close()
+        if self.semantic is not None:
+            self.semantic.close()
@@ -11,6 +11,7 @@ Usage examples:
   python quick_conversation.py "Business Plan" "Create a startup plan" 5 "creative" "analytical"
 """
 
+import asyncio
 import sys
 import os
 
@@ -20,6 +21,19 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from conversation_orchestrator import CodexInstance, ConversationOrchestrator
 
 
+# Predefined personality prompts, keyed by type
+PERSONALITIES = {
+    "creative": "You are a creative and innovative AI assistant. Focus on generating new ideas, thinking outside the box, and exploring unconventional solutions.",
+    "analytical": "You are a practical and analytical AI assistant. Focus on refining ideas, providing detailed implementation suggestions, and considering practical constraints.",
+    "optimistic": "You are an optimistic and enthusiastic AI assistant. Focus on opportunities, positive outcomes, and what can go right rather than what can go wrong.",
+    "realistic": "You are a practical and realistic AI assistant. Focus on practical constraints, potential issues, and real-world implementation challenges.",
+    "strategic": "You are a strategic and high-level AI assistant. Focus on big-picture thinking, long-term planning, and overall vision.",
+    "tactical": "You are a tactical and detail-oriented AI assistant. Focus on specific implementation details, step-by-step planning, and execution strategies.",
+    "user-focused": "You are a user-focused AI assistant. Focus on user experience, customer needs, and how solutions benefit end users.",
+    "technical": "You are a technical and implementation-focused AI assistant. Focus on technical feasibility, architecture, and engineering considerations."
+}
+
+
 def get_personality_by_type(personality_type: str) -> str:
     """
     Get a predefined personality based on type.
@@ -30,18 +44,7 @@ def get_personality_by_type(personality_type: str) -> str:
     Returns:
         str: Personality prompt
     """
-    personalities = {
-        "creative": "You are a creative and innovative AI assistant. Focus on generating new ideas, thinking outside the box, and exploring unconventional solutions.",
-        "analytical": "You are a practical and analytical AI assistant. Focus on refining ideas, providing detailed implementation suggestions, and considering practical constraints.",
-        "optimistic": "You are an optimistic and enthusiastic AI assistant. Focus on opportunities, positive outcomes, and what can go right rather than what can go wrong.",
-        "realistic": "You are a practical and realistic AI assistant. Focus on practical constraints, potential issues, and real-world implementation challenges.",
-        "strategic": "You are a strategic and high-level AI assistant. Focus on big-picture thinking, long-term planning, and overall vision.",
-        "tactical": "You are a tactical and detail-oriented AI assistant. Focus on specific implementation details, step-by-step planning, and execution strategies.",
-        "user-focused": "You are a user-focused AI assistant. Focus on user experience, customer needs, and how solutions benefit end users.",
-        "technical": "You are a technical and implementation-focused AI assistant. Focus on technical feasibility, architecture, and engineering considerations."
-    }
-    
-    return personalities.get(personality_type.lower(), personalities["creative"])
+    return PERSONALITIES.get(personality_type.lower(), PERSONALITIES["creative"])
 
 
 def main():
@@ -113,7 +116,7 @@ def main():
     print("=" * 60)
     
     try:
-        orchestrator.start_conversation(initial_prompt, rounds)
+        asyncio.run(orchestrator.start_conversation(initial_prompt, rounds))
         print(f"\n✅ Conversation completed! Saved to: {orchestrator.get_conversation_filename()}")
     except KeyboardInterrupt:
         print("\n\nConversation interrupted by user.")
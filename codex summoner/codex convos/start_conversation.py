@@ -12,6 +12,7 @@ This script provides an interactive interface to:
 Usage: python start_conversation.py
 """
 
+import asyncio
 import sys
 import os
 
@@ -103,7 +104,7 @@ def main():
     print("\n" + "=" * 60)
     
     try:
-        orchestrator.start_conversation(initial_prompt, rounds)
+        asyncio.run(orchestrator.start_conversation(initial_prompt, rounds))
     except KeyboardInterrupt:
         print("\n\nConversation interrupted by user.")
         print("Saving partial conversation...")
@@ -9,57 +9,9 @@ Then enter your prompt when asked.
 
 import subprocess
 import sys
-import shlex
-import json
 import re
 
-
-def parse_codex_output(raw_output: str) -> str:
-    """
-    Parse the JSON output from codex command and extract clean text response.
-    
-    Args:
-        raw_output (str): Raw output from codex command
-        
-    Returns:
-        str: Clean text response without JSON metadata
-    """
-    lines = raw_output.strip().split('\n')
-    clean_responses = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        try:
-            # Try to parse as JSON
-            data = json.loads(line)
-            
-            # Look for assistant message with output_text content
-            if (data.get('type') == 'message' and 
-                data.get('role') == 'assistant' and 
-                data.get('status') == 'completed' and
-                'content' in data):
-                
-                for content_item in data['content']:
-                    if (isinstance(content_item, dict) and 
-                        content_item.get('type') == 'output_text' and
-                        'text' in content_item):
-                        clean_responses.append(content_item['text'].strip())
-                        
-        except json.JSONDecodeError:
-            # If it's not JSON, it might be plain text output
-            # Only include if it doesn't look like JSON
-            if not line.startswith('{') and not line.startswith('['):
-                clean_responses.append(line)
-    
-    # Join all clean responses
-    if clean_responses:
-        return '\n'.join(clean_responses)
-    else:
-        # If no clean responses found, return the original output
-        return raw_output
+from codex_utils import parse_codex_output, build_codex_argv
 
 
 def run_codex_command(prompt: str) -> str:
@@ -72,15 +24,14 @@ def run_codex_command(prompt: str) -> str:
     Returns:
         str: The output from the codex command
     """
-    # Construct the command: codex -m o3 "user_prompt"
-    command = f'codex --full-auto -q -m o3 "{prompt}"'
+    argv = build_codex_argv("o3", prompt)
     
     try:
         # Execute the command using subprocess
         # capture_output=True captures both stdout and stderr
         # text=True returns strings instead of bytes
         result = subprocess.run(
-            shlex.split(command),  # Split command safely for shell execution
+            argv,
             capture_output=True,
             text=True,
             timeout=60  # 60 second timeout
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Codex Utilities - Shared helpers for working with codex command output.
+
+Used by both codex.py and the conversation orchestrator in codex convos/.
+"""
+
+import functools
+import json
+from typing import AsyncIterable, AsyncIterator, List
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library parser if orjson is not installed
+    _json_loads = json.loads
+
+
+# (type, role, status) of the assistant message that carries the final response
+_COMPLETED_MESSAGE = ('message', 'assistant', 'completed')
+
+
+def _load_completed_message(line: str):
+    """
+    Parse a JSON output line and return it if it is a completed assistant message.
+    
+    Args:
+        line (str): A single stripped line starting with '{'
+    
+    Returns:
+        dict: The parsed message, or None for any other line
+    """
+    try:
+        data = _json_loads(line)
+        if (data['type'], data['role'], data['status']) == _COMPLETED_MESSAGE:
+            return data
+    except (ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _line_fragments(line: str) -> List[str]:
+    """
+    Extract the clean text fragments carried by a single line of codex output.
+    
+    Args:
+        line (str): A single line of codex output
+    
+    Returns:
+        List[str]: Response text found on the line (usually zero or one item)
+    """
+    line = line.strip()
+    if not line:
+        return []
+    
+    if line[0] == '{':
+        # Only the completed assistant message carries response text
+        data = _load_completed_message(line)
+        if data is None:
+            return []
+        
+        return [
+            content_item['text'].strip()
+            for content_item in data.get('content', ())
+            if (isinstance(content_item, dict) and
+                content_item.get('type') == 'output_text' and
+                'text' in content_item)
+        ]
+    
+    if line[0] != '[':
+        # Plain text output that doesn't look like JSON
+        return [line]
+    return []
+
+
+async def aiter_codex_output(lines: AsyncIterable[str]) -> AsyncIterator[str]:
+    """
+    Streaming variant of parse_codex_output that yields fragments as lines arrive.
+    
+    Args:
+        lines (AsyncIterable[str]): Lines of codex output, e.g. read from a process's stdout
+    
+    Yields:
+        str: Clean text fragments, or the raw output if none were found
+    """
+    raw_lines = []
+    found = False
+    
+    async for line in lines:
+        raw_lines.append(line)
+        for fragment in _line_fragments(line):
+            found = True
+            yield fragment
+    
+    if not found:
+        # If no clean responses found, return the original output
+        raw_output = ''.join(raw_lines).strip()
+        if raw_output:
+            yield raw_output
+
+
+def build_codex_argv(model: str, prompt: str) -> List[str]:
+    """
+    Build the argv for a one-shot codex call.
+    
+    Args:
+        model (str): Model to run, e.g. "o3"
+        prompt (str): The prompt, passed as its own argument so quotes need no escaping
+    
+    Returns:
+        List[str]: Arguments for subprocess
+    """
+    return ["codex", "--full-auto", "-q", "-m", model, prompt]
+
+
+@functools.lru_cache(maxsize=256)
+def parse_codex_output(raw_output: str) -> str:
+    """
+    Parse the JSON output from codex command and extract clean text response.
+    
+    Args:
+        raw_output (str): Raw output from codex command
+    
+    Returns:
+        str: Clean text response without JSON metadata
+    """
+    clean_responses = []
+    for line in raw_output.split('\n'):
+        clean_responses.extend(_line_fragments(line))
+    
+    # Join all clean responses
+    if clean_responses:
+        return '\n'.join(clean_responses)
+    else:
+        # If no clean responses found, return the original output
+        return raw_output
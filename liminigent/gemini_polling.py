@@ -12,9 +12,11 @@ Context Management Strategy:
 """
 
 import asyncio
-import requests
+import atexit
+import httpx
 import time
 import json
+from collections import OrderedDict
 import os
 import re
 import pytz
@@ -32,6 +34,34 @@ except ImportError:
     # If python-dotenv is not installed, we'll just use system environment variables
     pass
 
+# Whole-word, case-insensitive "Gemini" mention
+_GEMINI_RE = re.compile(r'\b(gemini)\b', re.IGNORECASE)
+
+# Marker line separating triggers in a batched gemini-cli query and its response
+_TRIGGER_MARKER_RE = re.compile(r'^\s*===TRIGGER (\d+)===\s*$', re.MULTILINE)
+
+# Fast 64-bit content hash for change detection, falling back to Python's str hash
+try:
+    import xxhash
+    
+    def _content_hash(text):
+        return xxhash.xxh3_64_intdigest(text.encode("utf-8"))
+except ImportError:
+    _content_hash = hash
+
+# Parse Limitless responses with orjson if installed, otherwise the standard library
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use diff-match-patch for debug diffs if installed, otherwise fall back to difflib
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None
+
 # Remove the poll_agent1 import since we're using gemini-cli now
 # sys.path.append(str(Path(__file__).parent.parent))
 # from poll_agent1 import analyze_transcript_with_agent
@@ -45,16 +75,122 @@ class TranscriptManager:
     (Replicates enhanced_polling.py functionality)
     """
     
-    def __init__(self, base_path):
-        """Initialize the transcript management system."""
+    def __init__(self, base_path, context_limit=96000):
+        """
+        Initialize the transcript management system.
+        
+        Args:
+            base_path: Root folder for the year/month/date transcript folders
+            context_limit (int): Bytes from the end of the current transcript kept in memory
+        """
         self.base_path = Path(base_path)
         self.est = pytz.timezone('US/Eastern')
+        
+        # date_str -> transcript path whose folder has already been created
+        self._transcript_paths = {}
+        
+        # Rolling copy of the end of the current transcript, so building Gemini context
+        # doesn't read the file back from disk
+        self.context_limit = context_limit
+        self._context_path = None
+        self._context_buf = bytearray()
+        self._context_truncated = False  # True once the buffer no longer holds the whole file
+        
+        # Append-only file descriptors for the current day's folder, kept open between
+        # writes so each append is a single os.write (O_APPEND keeps it at the end of the file)
+        self._fd_cache = {}  # Path -> fd
+        self._fd_folder = None
+        atexit.register(self.close)
+        
+        # Myers diff with a time cap, so a pathological update can't stall the polling loop
+        self._dmp = None
+        if diff_match_patch is not None:
+            self._dmp = diff_match_patch()
+            self._dmp.Diff_Timeout = 0.1
+    
+    def _get_fd(self, path):
+        """Get a cached append-only descriptor for path, closing the previous day's on rollover."""
+        if path.parent != self._fd_folder:
+            self.close()
+            self._fd_folder = path.parent
+        
+        fd = self._fd_cache.get(path)
+        if fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+            fd = os.open(path, flags, 0o644)
+            self._fd_cache[path] = fd
+        return fd
+    
+    def _write(self, path, data):
+        """Append bytes to path through its cached descriptor, retrying short writes."""
+        fd = self._get_fd(path)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _load_context(self, path):
+        """Point the context buffer at path, filling it once from the end of the file."""
+        if path == self._context_path:
+            return
+        
+        self._context_path = path
+        self._context_buf = bytearray()
+        self._context_truncated = False
+        
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return
+        
+        with open(path, 'rb') as f:
+            if size > self.context_limit:
+                f.seek(-self.context_limit, os.SEEK_END)
+                self._context_truncated = True
+            self._context_buf += f.read()
+    
+    def _add_to_context(self, path, data):
+        """Append bytes just written to path to the context buffer, dropping the oldest overflow."""
+        self._load_context(path)
+        self._context_buf += data
+        
+        excess = len(self._context_buf) - self.context_limit
+        if excess > 0:
+            del self._context_buf[:excess]
+            self._context_truncated = True
+    
+    def get_context_bytes(self, path):
+        """
+        Get the end of a transcript from memory.
+        
+        Args:
+            path: Path of the transcript file
+            
+        Returns:
+            tuple: (bytes, truncated) with at most context_limit bytes, or None if the
+                transcript doesn't exist
+        """
+        self._load_context(path)
+        if not self._context_buf and not path.exists():
+            return None
+        return bytes(self._context_buf), self._context_truncated
+    
+    def close(self):
+        """Close all cached transcript file descriptors."""
+        for fd in self._fd_cache.values():
+            os.close(fd)
+        self._fd_cache.clear()
+        self._fd_folder = None
     
     def get_daily_transcript_path(self, date_str=None):
         """Get the file path for a daily transcript."""
         if date_str is None:
             date_str = datetime.now(self.est).strftime('%Y-%m-%d')
         
+        # The folder only needs creating once per date
+        transcript_path = self._transcript_paths.get(date_str)
+        if transcript_path is not None:
+            return transcript_path
+        
         # Parse date components
         year, month, day = date_str.split('-')
         
@@ -62,60 +198,122 @@ class TranscriptManager:
         folder_path = self.base_path / year / month / day
         folder_path.mkdir(parents=True, exist_ok=True)
         
-        return folder_path / "transcript.txt"
+        transcript_path = folder_path / "transcript.txt"
+        self._transcript_paths[date_str] = transcript_path
+        return transcript_path
     
     def initialize_daily_transcript(self, date_str=None):
         """Initialize a daily transcript file with header information."""
         transcript_path = self.get_daily_transcript_path(date_str)
         
         if not transcript_path.exists():
+            # The transcript (or its whole folder) may have been removed or rotated while
+            # running, so recreate the folder and drop descriptors and context for the old file.
+            # This is the only place a stale descriptor is detected, so appends skip the fstat
+            transcript_path.parent.mkdir(parents=True, exist_ok=True)
+            self.close()
+            self._context_path = None
+            
             # Create new transcript with header
-            with open(transcript_path, 'w') as f:
-                f.write(f"# Daily Limitless Transcript - {date_str or 'Today'}\n")
-                f.write(f"# Generated: {datetime.now(self.est).strftime('%Y-%m-%d %H:%M:%S %Z')}\n")
-                f.write(f"# Gemini triggers will be highlighted in **bold**\n")
-                f.write("\n---\n\n")
+            self._load_context(transcript_path)
+            header = (
+                f"# Daily Limitless Transcript - {date_str or 'Today'}\n"
+                f"# Generated: {datetime.now(self.est).strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+                f"# Gemini triggers will be highlighted in **bold**\n"
+                "\n---\n\n"
+            )
+            with open(transcript_path, 'w', encoding='utf-8') as f:
+                f.write(header)
+            self._add_to_context(transcript_path, header.encode("utf-8"))
             
             print(f"Created new daily transcript: {transcript_path}")
     
     def append_to_transcript(self, content, timestamp, title="Limitless Update", date_str=None):
         """Append new content to the daily transcript."""
         transcript_path = self.get_daily_transcript_path(date_str)
+        # Fill the context buffer from disk before this entry lands there
+        self._load_context(transcript_path)
         self.initialize_daily_transcript(date_str)
         
-        # Format the entry
+        # Format the entry straight into bytes, ready to append in one write
         entry_time = datetime.now(self.est).strftime('%H:%M:%S')
-        entry = f"\n## {title} - {entry_time}\n"
-        entry += f"*Content timestamp: {timestamp}*\n\n"
-        entry += f"{content}\n\n---\n"
+        entry_bytes = b"".join((
+            b"\n## ", title.encode("utf-8"), b" - ", entry_time.encode("utf-8"), b"\n",
+            b"*Content timestamp: ", str(timestamp).encode("utf-8"), b"*\n\n",
+            content.encode("utf-8"), b"\n\n---\n"
+        ))
         
         # Append to transcript
-        with open(transcript_path, 'a') as f:
-            f.write(entry)
+        self._write(transcript_path, entry_bytes)
+        self._add_to_context(transcript_path, entry_bytes)
     
-    def log_difference(self, prev_content, new_content, timestamp, title="Limitless Update", date_str=None):
-        """Log the differences between previous and new content."""
-        # Generate diff for debugging (not shown in main transcript)
-        diff = list(difflib.unified_diff(
-            prev_content.splitlines(),
-            new_content.splitlines(),
+    def diff_text(self, prev_lines, new_lines):
+        """
+        Describe the line changes between two versions of a lifelog.
+        
+        Returns the changed lines prefixed with "+"/"-" when diff-match-patch is installed,
+        otherwise a unified diff. Returns an empty string if nothing changed.
+        """
+        if self._dmp is not None:
+            # Line-mode diff: map each distinct line to one character, diff those,
+            # then expand the result back into lines
+            line_array = [""]
+            line_index = {}
+            
+            def encode(lines):
+                chars = []
+                for line in lines:
+                    if line not in line_index:
+                        line_index[line] = len(line_array)
+                        line_array.append(line + "\n")
+                    chars.append(chr(line_index[line]))
+                return "".join(chars)
+            
+            diffs = self._dmp.diff_main(encode(prev_lines), encode(new_lines), False)
+            self._dmp.diff_charsToLines(diffs, line_array)
+            
+            # Render the changed lines directly; patch_toText would URL-encode them
+            prefixes = {self._dmp.DIFF_INSERT: "+", self._dmp.DIFF_DELETE: "-"}
+            return "\n".join(
+                prefixes[op] + line
+                for op, text in diffs if op in prefixes
+                for line in text.splitlines()
+            )
+        
+        return "\n".join(difflib.unified_diff(
+            prev_lines,
+            new_lines,
             lineterm="",
             fromfile="previous",
             tofile="updated"
         ))
+    
+    def log_difference(self, prev_lines, new_lines, content, timestamp, title="Limitless Update", date_str=None):
+        """
+        Log an updated lifelog to the transcript and its line diff to the debug file.
+        
+        Args:
+            prev_lines (list): Previous raw content, already split into lines
+            new_lines (list): New raw content, already split into lines
+            content (str): Content to write to the transcript (with Gemini highlighted)
+        """
+        # Generate diff for debugging (not shown in main transcript)
+        diff = self.diff_text(prev_lines, new_lines)
         
         # Log the update to transcript
-        self.append_to_transcript(new_content, timestamp, title, date_str)
+        self.append_to_transcript(content, timestamp, title, date_str)
         
         # Optionally log detailed diff to a separate debug file
         if diff:
             debug_path = self.get_daily_transcript_path(date_str).parent / "debug_diffs.txt"
-            with open(debug_path, 'a') as f:
-                f.write(f"\n--- Diff at {datetime.now(self.est).isoformat()} ---\n")
-                f.write(f"Title: {title}\n")
-                f.write(f"Content timestamp: {timestamp}\n")
-                f.write("\n".join(diff))
-                f.write("\n\n")
+            debug_entry = (
+                f"\n--- Diff at {datetime.now(self.est).isoformat()} ---\n"
+                f"Title: {title}\n"
+                f"Content timestamp: {timestamp}\n"
+                + diff
+                + "\n\n"
+            )
+            self._write(debug_path, debug_entry.encode("utf-8"))
 
 class GeminiPollingEngine:
     """
@@ -134,29 +332,66 @@ class GeminiPollingEngine:
         self.api_url = "https://api.limitless.ai/v1/lifelogs"
         self.headers = {"X-API-Key": self.api_key, "Accept": "application/json"}
         
+        # Shared keep-alive HTTP client for Limitless and NTFY, created on first use so it
+        # binds to the running event loop. Limitless headers are passed per request so the
+        # API key is never sent to other hosts.
+        self._http = None
+        
+        # (request params, ETag) of the last Limitless response, for conditional GETs
+        self._last_etag = None
+        
         # NTFY Configuration for agent responses
         self.ntfy_url = "https://ntfy.sh/clark-m-gemini-agent"
         
+        # With GEMINI_API_KEY set, queries go straight to the Gemini REST API over the
+        # shared HTTP client instead of starting a gemini-cli (Node.js) process each time
+        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
+        self.gemini_model = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
+        self.gemini_api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.gemini_model}:generateContent"
+        
         # Context management - limit to 96000 chars to prevent token overflow
         self.max_context_chars = 96000
         
         # Polling Configuration (same as enhanced_polling.py)
-        self.backoff_initial = 5
+        # The base interval can be overridden with LIMITLESS_POLL_INTERVAL (seconds)
+        self.backoff_initial = float(os.getenv("LIMITLESS_POLL_INTERVAL", "5"))
         self.backoff_max = 300
         self.stable_polls_required = 3
         
+        # Idle polls double the interval (up to 2**6 times the base, capped at backoff_max)
+        self.max_idle_doublings = 6
+        
+        # Set by notify_change() to cut the current wait short; created in run() so it
+        # belongs to the running event loop
+        self._change_event = None
+        
         # Timezone and paths - reuse enhanced_polling.py structure
         self.est = pytz.timezone('US/Eastern')
         self.base_path = Path(__file__).parent / "logs"
         
         # Initialize transcript manager
-        self.transcript_manager = TranscriptManager(self.base_path)
+        self.transcript_manager = TranscriptManager(self.base_path, context_limit=self.max_context_chars)
         
         # Track Gemini triggers that have already been processed to avoid duplicates
-        self.processed_gemini_triggers = set()
+        # as (lifelog_id, endTime) keys, oldest first, capped at max_processed_triggers so it
+        # doesn't grow across days
+        self.processed_gemini_triggers = OrderedDict()
+        self.max_processed_triggers = 4096
+        
+        # Triggers found in the same poll are sent to gemini-cli together, up to this many per call
+        self.max_trigger_batch = 8
+        
+        # Triggers are processed in background tasks so polling never waits on Gemini;
+        # at most max_concurrent_gemini queries run at once to stay within API quotas
+        self.max_concurrent_gemini = 2
+        self._gemini_sem = None  # Created in run() so it belongs to the running event loop
+        self._pending = set()  # Outstanding trigger tasks
         
-        # Check if gemini-cli is available
-        self.check_gemini_cli_availability()
+        # Check if gemini-cli is available (only needed without an API key)
+        if self.gemini_api_key:
+            print(f"✅ Using Gemini API directly ({self.gemini_model})")
+        else:
+            self.check_gemini_cli_availability()
         
         print("Gemini Polling Engine initialized - monitoring for Gemini triggers")
     
@@ -183,12 +418,57 @@ class GeminiPollingEngine:
         except Exception as e:
             print(f"❌ Error checking gemini-cli: {e}")
     
+    def next_poll_interval(self, consecutive_idle_polls):
+        """
+        Get the wait before the next poll.
+        
+        Polls right after a change use the base interval; each poll that finds
+        nothing new doubles it, up to backoff_max.
+        """
+        doublings = min(consecutive_idle_polls, self.max_idle_doublings)
+        return min(self.backoff_max, self.backoff_initial * (2 ** doublings))
+    
+    def notify_change(self):
+        """
+        Wake the polling loop immediately, e.g. from a webhook or push handler.
+        """
+        if self._change_event is not None:
+            self._change_event.set()
+    
+    async def wait_for_next_poll(self, interval):
+        """Sleep until the next poll is due or notify_change() is called."""
+        try:
+            await asyncio.wait_for(self._change_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        self._change_event.clear()
+    
+    def http_client(self):
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=30, http2=True)
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
     def today_est_date(self):
         """Get today's date in EST timezone."""
         return datetime.now(self.est).strftime('%Y-%m-%d')
     
-    def fetch_lifelogs(self, date=None, start=None):
-        """Fetch lifelogs from Limitless API (same as enhanced_polling.py)."""
+    async def fetch_lifelogs(self, date=None, start=None):
+        """
+        Fetch lifelogs from Limitless API (same as enhanced_polling.py).
+        
+        Repeats of the previous request are sent as conditional GETs when Limitless
+        returned an ETag for it.
+        
+        Returns:
+            list: Lifelogs oldest first, or None if nothing changed since the last fetch (304)
+        """
         params = {
             "timezone": "US/Eastern",
             "includeMarkdown": "true", 
@@ -197,11 +477,25 @@ class GeminiPollingEngine:
             "limit": 1000
         }
         if date: params["date"] = date
-        if start: params["start"] = start
+        if start:
+            # Only lifelogs since the stable cursor are returned, so a short page is enough
+            params["start"] = start
+            params["limit"] = 50
+        
+        headers = self.headers
+        params_key = tuple(params.items())
+        if self._last_etag is not None and self._last_etag[0] == params_key:
+            headers = {**self.headers, "If-None-Match": self._last_etag[1]}
         
-        response = requests.get(self.api_url, headers=self.headers, params=params)
+        response = await self.http_client().get(self.api_url, headers=headers, params=params)
+        if response.status_code == 304:
+            return None
         response.raise_for_status()
-        data = response.json()
+        
+        etag = response.headers.get("ETag")
+        self._last_etag = (params_key, etag) if etag else None
+        
+        data = _json_loads(response.content)
         return list(reversed(data.get("data", {}).get("lifelogs", [])))
     
     def detect_gemini_trigger(self, text):
@@ -210,10 +504,8 @@ class GeminiPollingEngine:
         
         Returns True if Gemini is mentioned, False otherwise.
         """
-        if not text:
-            return False
         # Use word boundaries to match only complete words "Gemini"
-        return bool(re.search(r'\bgemini\b', text, re.IGNORECASE))
+        return bool(text) and _GEMINI_RE.search(text) is not None
     
     def highlight_gemini_content(self, content):
         """
@@ -228,15 +520,24 @@ class GeminiPollingEngine:
         if not content:
             return content
         
-        # Case-insensitive search with word boundaries
-        pattern = r'\b(gemini)\b'
+        # Replace all instances with bold markdown
+        return _GEMINI_RE.sub(r'**\1**', content)
+    
+    def scan_gemini_content(self, content):
+        """
+        Highlight Gemini mentions and detect a trigger in a single pass.
         
-        def replace_match(match):
-            """Replace function to bold the match."""
-            return f"**{match.group(1)}**"
+        Args:
+            content (str): Text content to process
+            
+        Returns:
+            tuple: (content with Gemini mentions in **bold**, True if Gemini was mentioned)
+        """
+        if not content:
+            return content, False
         
-        # Replace all instances with bold markdown
-        return re.sub(pattern, replace_match, content, flags=re.IGNORECASE)
+        highlighted, mentions = _GEMINI_RE.subn(r'**\1**', content)
+        return highlighted, mentions > 0
     
     def get_current_transcript_context(self):
         """
@@ -251,21 +552,23 @@ class GeminiPollingEngine:
         # Use same path structure as enhanced_polling.py
         transcript_path = self.base_path / year / month / day / "transcript.txt"
         
-        if not transcript_path.exists():
-            return f"No transcript found for {date_str}"
-        
         try:
-            with open(transcript_path, 'r') as f:
-                full_content = f.read()
+            # The transcript manager keeps the end of today's transcript in memory and
+            # only reads the file once, when it first sees it
+            context = self.transcript_manager.get_context_bytes(transcript_path)
+            if context is None:
+                return f"No transcript found for {date_str}"
+            content, truncated = context
             
-            # If content is within limit, return as-is
-            if len(full_content) <= self.max_context_chars:
-                return full_content
+            # If content is within limit, return as-is (a transcript within the limit in
+            # bytes is within it in characters too)
+            if not truncated:
+                return content.decode('utf-8', errors='ignore')
             
             # Otherwise, take the most recent content (end of file) with buffer
             # Use slightly smaller limit to ensure we stay under after line adjustment
             safe_limit = self.max_context_chars - 100  # 100 char safety buffer
-            truncated = full_content[-safe_limit:]
+            truncated = content[-safe_limit:].decode('utf-8', errors='ignore')
             
             # Find the first complete line to avoid cutting mid-sentence
             first_newline = truncated.find('\n')
@@ -312,7 +615,7 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
             print("🤖 Sending context to gemini-cli for analysis...")
             
             # Use gemini-cli with our constructed query
-            response = await self.run_gemini_cli_query(gemini_query)
+            response = await self.run_gemini_query(gemini_query)
             
             if response:
                 print("✅ gemini-cli analysis complete - sending notification...")
@@ -324,31 +627,166 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
             print(f"❌ Error processing Gemini trigger: {e}")
             await self.send_error_notification(str(e))
     
+    async def process_gemini_trigger_batch(self, triggers):
+        """
+        Process several Gemini triggers from the same poll with a single gemini-cli call.
+        
+        Each trigger is sent under a ===TRIGGER N=== marker and gemini-cli is asked to
+        answer under the same markers, so the response can be split back into one
+        notification per trigger.
+        
+        Args:
+            triggers: List of (lifelog, processed_content) tuples
+        """
+        print(f"🔍 {len(triggers)} Gemini triggers detected - gathering context for one gemini-cli analysis...")
+        
+        # Get current transcript context
+        context = self.get_current_transcript_context()
+        
+        sections = []
+        for number, (lifelog, processed_content) in enumerate(triggers, 1):
+            sections.append(
+                f"===TRIGGER {number}===\n"
+                f"Title: {lifelog.get('title', 'Limitless Update')}\n"
+                f"Time: {lifelog.get('endTime', '')}\n"
+                f"Content: {processed_content}"
+            )
+        trigger_sections = "\n\n".join(sections)
+        
+        gemini_query = f"""TRANSCRIPT ANALYSIS REQUEST - RESPOND VERY BRIEFLY (MAX 500 WORDS PER TRIGGER)
+
+Current Trigger Entries ({len(triggers)}):
+{trigger_sections}
+
+Full Context (Today's Transcript):
+{context}
+
+Please provide a VERY BRIEF analysis (max 500 words) for EACH trigger entry above, addressing any questions or requests in the transcript, particularly focusing on the Gemini-related content. Start each analysis with its marker line exactly as given above (for example ===TRIGGER 1===) on its own line. Keep responses short and actionable for mobile notifications."""
+        
+        try:
+            print("🤖 Sending batched context to gemini-cli for analysis...")
+            
+            response = await self.run_gemini_query(gemini_query)
+            
+            if not response:
+                print("❌ No response from gemini-cli")
+                return
+            
+            print("✅ gemini-cli analysis complete - sending notifications...")
+            answers = self.split_batch_response(response)
+            
+            missing = []
+            for number, (lifelog, _) in enumerate(triggers, 1):
+                title = lifelog.get("title", "Limitless Update")
+                answer = answers.get(number)
+                if answer:
+                    await self.send_agent_response_notification(answer, title)
+                else:
+                    missing.append(title)
+            
+            if missing:
+                # Markers weren't echoed back for these triggers, so send them the whole
+                # response once rather than dropping them
+                if answers:
+                    print(f"⚠️  No marked answer for {len(missing)} of {len(triggers)} triggers - sending the full response for them")
+                await self.send_agent_response_notification(response, ", ".join(missing))
+                
+        except Exception as e:
+            print(f"❌ Error processing batched Gemini triggers: {e}")
+            await self.send_error_notification(str(e))
+    
+    def split_batch_response(self, response):
+        """
+        Split a batched gemini-cli response on its ===TRIGGER N=== markers.
+        
+        Returns:
+            dict: Trigger number -> answer text (empty if no markers were found)
+        """
+        parts = _TRIGGER_MARKER_RE.split(response)
+        # parts is [preamble, number, answer, number, answer, ...]
+        return {
+            int(number): answer.strip()
+            for number, answer in zip(parts[1::2], parts[2::2])
+        }
+    
+    async def run_gemini_query(self, query):
+        """
+        Run a query through the Gemini API if GEMINI_API_KEY is set, otherwise gemini-cli.
+        
+        Returns:
+            str: The response text, or None on failure
+        """
+        if self.gemini_api_key:
+            return await self.run_gemini_api_query(query)
+        return await self.run_gemini_cli_query(query)
+    
+    async def run_gemini_api_query(self, query):
+        """
+        Run a query against the Gemini generateContent REST endpoint.
+        
+        Reuses the shared keep-alive HTTP client, so there is no process startup
+        or TLS handshake per query.
+        """
+        payload = {"contents": [{"role": "user", "parts": [{"text": query}]}]}
+        headers = {"x-goog-api-key": self.gemini_api_key}
+        
+        try:
+            response = await self.http_client().post(
+                self.gemini_api_url, json=payload, headers=headers,
+                timeout=60  # Same 60 second limit as gemini-cli
+            )
+            if response.status_code != 200:
+                print(f"❌ Gemini API error ({response.status_code}): {response.text[:500]}")
+                return None
+            
+            data = _json_loads(response.content)
+            candidates = data.get("candidates") or []
+            if not candidates:
+                print("❌ Gemini API returned no candidates")
+                return None
+            
+            parts = candidates[0].get("content", {}).get("parts", [])
+            text = "".join(part.get("text", "") for part in parts).strip()
+            return text or None
+            
+        except httpx.TimeoutException:
+            print("❌ Gemini API request timed out")
+            return None
+        except Exception as e:
+            print(f"❌ Error calling Gemini API: {e}")
+            return None
+    
     async def run_gemini_cli_query(self, query):
         """
-        Run gemini-cli with a custom query using subprocess.
+        Run gemini-cli with a custom query as an asyncio subprocess.
         
         This replaces the previous poll agent integration with direct gemini-cli calls.
+        Waiting on gemini-cli doesn't block the event loop, so polling and other
+        gemini-cli calls carry on in the meantime.
         """
+        proc = None
         try:
             # Run gemini-cli in headless mode with the query
             # gemini-cli automatically detects non-TTY input and runs headless
-            result = subprocess.run(
-                ["gemini"],
-                input=query,
-                capture_output=True,
-                text=True,
+            proc = await asyncio.create_subprocess_exec(
+                "gemini",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(query.encode("utf-8")),
                 timeout=60  # 60 second timeout for gemini-cli response
             )
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 # Return the stdout (gemini-cli response)
-                return result.stdout.strip()
+                return stdout.decode("utf-8", errors="replace").strip()
             else:
-                print(f"❌ gemini-cli error: {result.stderr}")
+                print(f"❌ gemini-cli error: {stderr.decode('utf-8', errors='replace')}")
                 return None
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print("❌ gemini-cli command timed out")
             return None
         except FileNotFoundError:
@@ -357,6 +795,11 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
         except Exception as e:
             print(f"❌ Error running gemini-cli: {e}")
             return None
+        finally:
+            # Don't leave gemini-cli running after a timeout or cancellation
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
     
     async def send_agent_response_notification(self, response, trigger_title):
         """Send the gemini-cli response as a clean text NTFY notification."""
@@ -379,7 +822,7 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
                 truncated_response = response[:max_response_len] + "...\n[Response truncated for mobile notification]"
                 message = f"🤖 Gemini AI Analysis\n\nTrigger: {trigger_title}\n\n{truncated_response}\n\n---\nGenerated by Gemini Polling Agent"
             
-            response_req = requests.post(self.ntfy_url, data=message.encode("utf-8"), headers=headers)
+            response_req = await self.http_client().post(self.ntfy_url, content=message.encode("utf-8"), headers=headers)
             response_req.raise_for_status()
             print("📱 gemini-cli response notification sent successfully")
         except Exception as e:
@@ -395,10 +838,30 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
         }
         
         try:
-            requests.post(self.ntfy_url, data=message.encode("utf-8"), headers=headers)
+            await self.http_client().post(self.ntfy_url, content=message.encode("utf-8"), headers=headers)
         except Exception as e:
             print(f"Failed to send error notification: {e}")
     
+    def update_stable_end_time(self, last_lifelogs, last_stable_end_time):
+        """
+        Get the latest endTime among lifelogs unchanged for stable_polls_required polls.
+        
+        Returns:
+            The new stable endTime, or last_stable_end_time if no lifelog is stable yet
+        """
+        stable_end_times = [
+            info["endTime"] for info in last_lifelogs.values()
+            if info["stable_count"] >= self.stable_polls_required
+        ]
+        if not stable_end_times:
+            return last_stable_end_time
+        
+        # Find the latest stable endTime
+        latest_stable = max(stable_end_times)
+        if last_stable_end_time != latest_stable:
+            print(f"Stable up to endTime: {latest_stable}")
+        return latest_stable
+    
     async def run(self):
         """
         Main polling loop - monitors for Gemini triggers and processes them.
@@ -406,10 +869,33 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
         Reuses the same polling logic as enhanced_polling.py but focuses
         specifically on Gemini detection and gemini-cli integration.
         """
+        try:
+            await self._poll_loop()
+        finally:
+            # Stop any trigger still being processed before closing the HTTP client
+            for task in self._pending:
+                task.cancel()
+            await asyncio.gather(*self._pending, return_exceptions=True)
+            await self.aclose()
+    
+    async def _guarded_process(self, batch):
+        """Process a batch of triggers once a Gemini slot is free."""
+        async with self._gemini_sem:
+            if len(batch) == 1:
+                await self.process_gemini_trigger(*batch[0])
+            else:
+                await self.process_gemini_trigger_batch(batch)
+    
+    async def _poll_loop(self):
+        """Poll Limitless until cancelled (see run)."""
         # State tracking (same as enhanced_polling.py)
-        last_lifelogs = {}  # lifelog_id -> {content, endTime, stable_count}
+        last_lifelogs = {}  # lifelog_id -> {hash, endTime, stable_count, lines}
         last_stable_end_time = None
         backoff = self.backoff_initial
+        consecutive_idle_polls = 0
+        first_poll = True
+        self._change_event = asyncio.Event()
+        self._gemini_sem = asyncio.Semaphore(self.max_concurrent_gemini)
         
         print("🚀 Starting Gemini polling loop...")
         
@@ -418,89 +904,124 @@ Please provide a VERY BRIEF analysis (max 500 words) addressing any questions or
                 # Fetch current lifelogs for today
                 date = self.today_est_date()
                 start = last_stable_end_time
-                lifelogs = self.fetch_lifelogs(date=date, start=start)
+                lifelogs = await self.fetch_lifelogs(date=date, start=start)
+                
+                if lifelogs is None:
+                    # Not modified: every tracked lifelog is unchanged, so skip parsing and diffing
+                    for info in last_lifelogs.values():
+                        info["stable_count"] += 1
+                    last_stable_end_time = self.update_stable_end_time(last_lifelogs, last_stable_end_time)
+                    consecutive_idle_polls += 1
+                    await self.wait_for_next_poll(self.next_poll_interval(consecutive_idle_polls))
+                    backoff = self.backoff_initial  # Reset backoff on success
+                    continue
                 
                 # Track updates
-                updated_ids = set()
-                most_recent_update = None  # (lifelog, prev_content, processed_content, has_gemini_trigger)
+                most_recent_update = None  # (lifelog, prev_lines, raw_content, processed_content, has_gemini_trigger)
+                pending_triggers = []  # (lifelog, processed_content) for new or changed lifelogs mentioning Gemini
+                
+                # Signature (content hash, endTime) of every returned lifelog; set arithmetic
+                # against the last snapshot leaves only new or changed lifelogs to process
+                current = {
+                    lifelog.get("id"): (_content_hash(lifelog.get("markdown") or ""), lifelog.get("endTime"))
+                    for lifelog in lifelogs
+                }
+                changed_ids = {
+                    lifelog_id for lifelog_id, signature in current.items()
+                    if lifelog_id not in last_lifelogs
+                    or (last_lifelogs[lifelog_id]["hash"], last_lifelogs[lifelog_id]["endTime"]) != signature
+                }
+                
+                # Lifelogs unchanged, increment stability counter
+                for lifelog_id in current.keys() - changed_ids:
+                    last_lifelogs[lifelog_id]["stable_count"] += 1
                 
-                # Process each lifelog (same logic as enhanced_polling.py)
-                for lifelog in lifelogs:
+                # Clean up tracking for removed lifelogs
+                for lifelog_id in last_lifelogs.keys() - current.keys():
+                    del last_lifelogs[lifelog_id]
+                
+                # Process each new or changed lifelog, oldest first (same logic as enhanced_polling.py)
+                changed_lifelogs = [lifelog for lifelog in lifelogs if lifelog.get("id") in changed_ids] if changed_ids else []
+                for lifelog in changed_lifelogs:
                     lifelog_id = lifelog.get("id")
                     raw_content = lifelog.get("markdown") or ""
                     end_time = lifelog.get("endTime")
-                    title = lifelog.get("title") or "Limitless Update"
                     prev = last_lifelogs.get(lifelog_id)
                     
                     # Process content for Gemini highlighting
-                    processed_content = self.highlight_gemini_content(raw_content)
-                    has_gemini_trigger = self.detect_gemini_trigger(raw_content)
+                    processed_content, has_gemini_trigger = self.scan_gemini_content(raw_content)
                     
                     if not prev:
                         # New lifelog discovered
-                        most_recent_update = (lifelog, "", processed_content, has_gemini_trigger)
-                        last_lifelogs[lifelog_id] = {
-                            "content": raw_content, 
-                            "endTime": end_time, 
-                            "stable_count": 1
-                        }
+                        most_recent_update = (lifelog, [], raw_content, processed_content, has_gemini_trigger)
+                        # On the first poll every lifelog is new; only the most recent one may trigger
+                        if has_gemini_trigger and not first_poll:
+                            pending_triggers.append((lifelog, processed_content))
                     else:
-                        if raw_content != prev["content"] or end_time != prev["endTime"]:
-                            # Lifelog was updated
-                            if (most_recent_update is None or end_time > most_recent_update[0]["endTime"]):
-                                most_recent_update = (lifelog, prev["content"], processed_content, has_gemini_trigger)
-                            last_lifelogs[lifelog_id] = {
-                                "content": raw_content, 
-                                "endTime": end_time, 
-                                "stable_count": 1
-                            }
-                        else:
-                            # Lifelog unchanged, increment stability counter
-                            last_lifelogs[lifelog_id]["stable_count"] += 1
+                        # Lifelog was updated
+                        if (most_recent_update is None or end_time > most_recent_update[0]["endTime"]):
+                            most_recent_update = (lifelog, prev["lines"], raw_content, processed_content, has_gemini_trigger)
+                        if has_gemini_trigger:
+                            pending_triggers.append((lifelog, processed_content))
                     
-                    updated_ids.add(lifelog_id)
+                    # Split lines are kept per lifelog, so whichever one updates next is
+                    # diffed against its own previous content without re-splitting it
+                    last_lifelogs[lifelog_id] = {
+                        "hash": current[lifelog_id][0], 
+                        "endTime": end_time, 
+                        "stable_count": 1,
+                        "lines": raw_content.splitlines()
+                    }
                 
-                # Clean up tracking for removed lifelogs
-                for lifelog_id in list(last_lifelogs.keys()):
-                    if lifelog_id not in updated_ids:
-                        del last_lifelogs[lifelog_id]
+                if first_poll and most_recent_update and most_recent_update[4]:
+                    pending_triggers.append((most_recent_update[0], most_recent_update[3]))
+                first_poll = False
+                
+                # Only process Gemini triggers we haven't processed for this exact content
+                new_triggers = []
+                for lifelog, processed_content in pending_triggers:
+                    # Create unique trigger identifier for this content
+                    trigger_id = (lifelog.get("id"), lifelog.get("endTime"))
+                    if trigger_id not in self.processed_gemini_triggers:
+                        print(f"🎯 NEW Gemini trigger found in lifelog: {lifelog.get('title') or 'Limitless Update'}")
+                        self.processed_gemini_triggers[trigger_id] = None
+                        if len(self.processed_gemini_triggers) > self.max_processed_triggers:
+                            self.processed_gemini_triggers.popitem(last=False)
+                        new_triggers.append((lifelog, processed_content))
+                
+                # Send triggers from this poll together rather than one gemini-cli call each,
+                # in the background so the next poll doesn't wait on Gemini
+                for i in range(0, len(new_triggers), self.max_trigger_batch):
+                    task = asyncio.create_task(self._guarded_process(new_triggers[i:i + self.max_trigger_batch]))
+                    self._pending.add(task)
+                    task.add_done_callback(self._pending.discard)
                 
                 # Process most recent update
                 if most_recent_update:
-                    lifelog, prev_content, processed_content, has_gemini_trigger = most_recent_update
+                    lifelog, prev_lines, raw_content, processed_content, has_gemini_trigger = most_recent_update
+                    new_lines = last_lifelogs[lifelog.get("id")]["lines"]
                     end_time = lifelog.get("endTime")
                     title = lifelog.get("title") or "Limitless Update"
-                    lifelog_id = lifelog.get("id")
-                    
-                    # Create unique trigger identifier for this content
-                    trigger_id = f"{lifelog_id}:{end_time}:{has_gemini_trigger}"
-                    
-                    # Only process Gemini trigger if it's new content with Gemini AND we haven't processed this exact trigger
-                    if has_gemini_trigger and trigger_id not in self.processed_gemini_triggers:
-                        print(f"🎯 NEW Gemini trigger found in lifelog: {title}")
-                        self.processed_gemini_triggers.add(trigger_id)
-                        await self.process_gemini_trigger(lifelog, processed_content)
+                    is_new_trigger = any(triggered is lifelog for triggered, _ in new_triggers)
                     
                     # Always log to daily transcript (like enhanced_polling.py)
                     self.transcript_manager.log_difference(
-                        prev_content, processed_content, end_time, title, date
+                        prev_lines, new_lines, processed_content, end_time, title, date
                     )
                     
-                    print(f"Updated transcript for {date} - Gemini trigger: {'Yes (NEW)' if has_gemini_trigger and trigger_id not in self.processed_gemini_triggers else 'No'}")
+                    print(f"Updated transcript for {date} - Gemini trigger: {'Yes (NEW)' if is_new_trigger else 'No'}")
                 
                 # Update stable endTime tracking (same as enhanced_polling.py)
-                stable_lifelogs = [
-                    (lid, info) for lid, info in last_lifelogs.items()
-                    if info["stable_count"] >= self.stable_polls_required
-                ]
-                if stable_lifelogs:
-                    # Find the latest stable endTime
-                    latest_stable = max(stable_lifelogs, key=lambda x: x[1]["endTime"])
-                    if last_stable_end_time != latest_stable[1]["endTime"]:
-                        print(f"Stable up to endTime: {latest_stable[1]['endTime']}")
-                    last_stable_end_time = latest_stable[1]["endTime"]
+                last_stable_end_time = self.update_stable_end_time(last_lifelogs, last_stable_end_time)
                 
-                await asyncio.sleep(backoff)
+                # Poll less often while nothing changes, and go back to the base interval
+                # as soon as something does
+                if most_recent_update:
+                    consecutive_idle_polls = 0
+                else:
+                    consecutive_idle_polls += 1
+                
+                await self.wait_for_next_poll(self.next_poll_interval(consecutive_idle_polls))
                 backoff = self.backoff_initial  # Reset backoff on success
                 
             except Exception as e:
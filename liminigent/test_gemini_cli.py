@@ -6,68 +6,85 @@ This script tests the gemini-cli functionality without running the full polling
 """
 
 import asyncio
-import subprocess
+import functools
+import shutil
 import os
 from gemini_polling import GeminiPollingEngine
 
+@functools.lru_cache(maxsize=1)
+def _gemini_env():
+    """Look up the Gemini API key and gemini-cli path once, for repeated test runs."""
+    return os.environ.get('GEMINI_API_KEY'), shutil.which("gemini")
+
+# Fixed test queries, built (and for the raw subprocess test, encoded) once at import
+_BASIC_QUERY_BYTES = "Hello! Please respond with 'gemini-cli is working' if you can see this message.".encode("utf-8")
+
+# Kept as text, since GeminiPollingEngine.run_gemini_cli_query takes a str and encodes it itself
+_TEST_QUERY = """TRANSCRIPT ANALYSIS REQUEST - RESPOND VERY BRIEFLY (MAX 100 WORDS)
+
+Current Trigger Entry:
+Title: Test Entry
+Time: 2024-01-01T12:00:00Z
+Content: This is a test entry with **Gemini** mentioned.
+
+Full Context (Today's Transcript):
+# Test Transcript
+This is a test transcript to verify gemini-cli integration is working properly.
+
+Please provide a VERY BRIEF analysis (max 100 words) addressing any questions or requests in the transcript, particularly focusing on the Gemini-related content. Keep responses short and actionable for mobile notifications."""
+
 async def test_gemini_cli_basic():
     """Test basic gemini-cli functionality."""
     print("🧪 Testing basic gemini-cli functionality...")
     
+    proc = None
     try:
         # Test if gemini-cli responds to a simple query
-        test_query = "Hello! Please respond with 'gemini-cli is working' if you can see this message."
-        
-        result = subprocess.run(
-            ["gemini"],
-            input=test_query,
-            capture_output=True,
-            text=True,
+        proc = await asyncio.create_subprocess_exec(
+            "gemini",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(_BASIC_QUERY_BYTES),
             timeout=30
         )
         
-        if result.returncode == 0:
+        if proc.returncode == 0:
             print("✅ gemini-cli responded successfully")
-            print(f"Response: {result.stdout.strip()}")
+            print(f"Response: {stdout.decode('utf-8', errors='replace').strip()}")
             return True
         else:
-            print(f"❌ gemini-cli error: {result.stderr}")
+            print(f"❌ gemini-cli error: {stderr.decode('utf-8', errors='replace')}")
             return False
             
     except FileNotFoundError:
         print("❌ gemini-cli not found. Please install with: npm i -g @google/gemini-cli")
         return False
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("❌ gemini-cli command timed out")
         return False
     except Exception as e:
         print(f"❌ Error testing gemini-cli: {e}")
         return False
+    finally:
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await proc.wait()
 
 async def test_polling_engine_gemini_cli():
     """Test the polling engine's gemini-cli integration."""
     print("\n🧪 Testing polling engine gemini-cli integration...")
     
     try:
-        # Create a test instance of the polling engine
-        engine = GeminiPollingEngine()
+        # Create a test instance of the polling engine; its constructor probes gemini-cli
+        # with a blocking subprocess, so build it in a thread to keep the other tests running
+        engine = await asyncio.to_thread(GeminiPollingEngine)
         
         # Test the gemini-cli query method with a simple test
-        test_query = """TRANSCRIPT ANALYSIS REQUEST - RESPOND VERY BRIEFLY (MAX 100 WORDS)
-
-Current Trigger Entry:
-Title: Test Entry
-Time: 2024-01-01T12:00:00Z
-Content: This is a test entry with **Gemini** mentioned.
-
-Full Context (Today's Transcript):
-# Test Transcript
-This is a test transcript to verify gemini-cli integration is working properly.
-
-Please provide a VERY BRIEF analysis (max 100 words) addressing any questions or requests in the transcript, particularly focusing on the Gemini-related content. Keep responses short and actionable for mobile notifications."""
-        
         print("🤖 Sending test query to gemini-cli...")
-        response = await engine.run_gemini_cli_query(test_query)
+        response = await engine.run_gemini_cli_query(_TEST_QUERY)
         
         if response:
             print("✅ gemini-cli integration test successful")
@@ -85,28 +102,19 @@ async def test_environment_setup():
     """Test if the environment is properly set up for gemini-cli."""
     print("\n🧪 Testing environment setup...")
     
+    api_key, gemini_path = _gemini_env()
+    
     # Check if GEMINI_API_KEY is set
-    api_key = os.environ.get('GEMINI_API_KEY')
     if api_key:
         print(f"✅ GEMINI_API_KEY is set (length: {len(api_key)})")
     else:
         print("⚠️  GEMINI_API_KEY not set - gemini-cli may prompt for authentication")
     
     # Check if gemini command is available
-    try:
-        result = subprocess.run(
-            ["which", "gemini"], 
-            capture_output=True, 
-            text=True
-        )
-        if result.returncode == 0:
-            gemini_path = result.stdout.strip()
-            print(f"✅ gemini-cli found at: {gemini_path}")
-        else:
-            print("❌ gemini-cli not found in PATH")
-            return False
-    except Exception as e:
-        print(f"❌ Error checking gemini-cli availability: {e}")
+    if gemini_path:
+        print(f"✅ gemini-cli found at: {gemini_path}")
+    else:
+        print("❌ gemini-cli not found in PATH")
         return False
     
     return True
@@ -115,20 +123,21 @@ async def main():
     """Run all tests."""
     print("🚀 Starting gemini-cli integration tests...\n")
     
-    # Test environment setup
-    env_ok = await test_environment_setup()
+    # Run the tests concurrently, so the total time is the slowest test rather than the sum
+    env_ok, basic_ok, integration_ok = await asyncio.gather(
+        test_environment_setup(),
+        test_gemini_cli_basic(),
+        test_polling_engine_gemini_cli()
+    )
+    
     if not env_ok:
         print("\n❌ Environment setup failed. Please install gemini-cli first.")
         return
     
-    # Test basic gemini-cli functionality
-    basic_ok = await test_gemini_cli_basic()
     if not basic_ok:
         print("\n❌ Basic gemini-cli test failed.")
         return
     
-    # Test polling engine integration
-    integration_ok = await test_polling_engine_gemini_cli()
     if not integration_ok:
         print("\n❌ Polling engine integration test failed.")
         return
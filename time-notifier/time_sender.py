@@ -5,64 +5,176 @@ Time Notifier Script
 Sends the current time to an ntfy endpoint every 30 seconds.
 """
 
-import requests
-import time
+import asyncio
+import httpx
 from datetime import datetime
 import sys
 import signal
 
+try:
+    import uringcore
+except ImportError:
+    # Fall back to the default asyncio event loop if uringcore is not installed
+    uringcore = None
+
 # Configuration
-NTFY_ENDPOINT = "https://ntfy.sh/clark-m-random"  # Using the random topic from the screenshot
+NTFY_SERVER = "https://ntfy.sh"
+NTFY_TOPIC = "clark-m-random"  # Using the random topic from the screenshot
+NTFY_ENDPOINT = f"{NTFY_SERVER}/{NTFY_TOPIC}"
 INTERVAL_SECONDS = 30
+BATCH_MISSED_TICKS = False  # Post every missed tick in one message instead of only the latest time
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.3  # Doubles after each failed attempt
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+SHUTDOWN_GRACE_SECONDS = 5  # How long stopping waits for a post still in flight
 
-def send_time_notification():
-    """Send current time to ntfy endpoint."""
-    try:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        message = f"Current time: {current_time}"
-        
-        response = requests.post(
-            NTFY_ENDPOINT,
-            data=message,
-            headers={
-                "Title": "Time Update",
-                "Priority": "default",
-                "Tags": "clock,time"
-            }
+NTFY_HEADERS = {
+    "Title": "Time Update",
+    "Priority": "default",
+    "Tags": "clock,time"
+}
+
+_date_cache = (None, "")  # (date ordinal, "%Y-%m-%d" string) for the current day
+
+def time_message():
+    """Format the message for the current time as the ASCII bytes that are posted."""
+    global _date_cache
+    now = datetime.now()
+
+    # The date only changes once a day, so only the time of day is formatted each tick
+    ordinal = now.toordinal()
+    if _date_cache[0] != ordinal:
+        _date_cache = (ordinal, now.strftime("%Y-%m-%d"))
+
+    return f"Current time: {_date_cache[1]} {now.hour:02d}:{now.minute:02d}:{now.second:02d}".encode("ascii")
+
+def make_client():
+    """Create the ntfy client: one keep-alive HTTP/2 connection to the server."""
+    # Posts that overlap go out as streams on the one connection rather than new connections
+    return httpx.AsyncClient(
+        base_url=NTFY_SERVER,
+        headers=NTFY_HEADERS,
+        timeout=httpx.Timeout(10, connect=3.05),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=1)
         )
-        
-        if response.status_code == 200:
-            print(f"✓ Sent: {message}")
-        else:
-            print(f"✗ Failed to send notification. Status: {response.status_code}")
-            
-    except requests.exceptions.RequestException as e:
-        print(f"✗ Network error: {e}")
-    except Exception as e:
-        print(f"✗ Unexpected error: {e}")
-
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully."""
-    print("\n\nStopping time notifier...")
-    sys.exit(0)
+    )
 
-def main():
+async def send_time_notification(client, messages):
+    """Send time messages to ntfy endpoint as a single post, returning True on success."""
+    # Already-encoded bytes go out as-is, with httpx setting Content-Length from their size
+    body = b"\n".join(messages)
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await client.post(f"/{NTFY_TOPIC}", content=body)
+
+            if response.status_code == 200:
+                if len(messages) == 1:
+                    print(f"✓ Sent: {body.decode()}")
+                else:
+                    print(f"✓ Sent {len(messages)} messages, latest: {messages[-1].decode()}")
+                return True
+            elif response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                print(f"✗ Failed to send notification. Status: {response.status_code}")
+                return False
+
+        except httpx.TransportError as e:
+            if attempt == MAX_RETRIES:
+                print(f"✗ Network error: {e}")
+                return False
+        except Exception as e:
+            print(f"✗ Unexpected error: {e}")
+            return False
+
+        # Transient failure, so retry with exponential backoff
+        await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+
+async def main():
     """Main loop to send time notifications every 30 seconds."""
     print(f"Starting time notifier...")
     print(f"Sending to: {NTFY_ENDPOINT}")
     print(f"Interval: {INTERVAL_SECONDS} seconds")
     print("Press Ctrl+C to stop\n")
-    
-    # Set up signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    
+
+    loop = asyncio.get_running_loop()
+
+    # Set up signal handlers for graceful shutdown; every way of stopping goes through stop_event
+    stop_event = asyncio.Event()
+    in_flight = None  # Task posting the current notification, if any
+
+    def request_stop():
+        if stop_event.is_set() and in_flight is not None:
+            # A second Ctrl+C stops waiting for the post in flight
+            in_flight.cancel()
+        stop_event.set()
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, request_stop)
+        loop.add_signal_handler(signal.SIGTERM, request_stop)
+    except NotImplementedError:
+        # Not available on Windows, so stop from a plain handler instead
+        signal.signal(signal.SIGINT, lambda signum, frame: loop.call_soon_threadsafe(request_stop))
+
+    client = make_client()
     try:
-        while True:
-            send_time_notification()
-            time.sleep(INTERVAL_SECONDS)
-    except KeyboardInterrupt:
-        print("\n\nStopping time notifier...")
-        sys.exit(0)
+        unsent = []  # Messages for ticks that haven't been posted yet
+
+        async def deliver(messages):
+            nonlocal client
+            if not await send_time_notification(client, messages):
+                # The connection may be left half-closed after persistent failures, so
+                # start the next post on a fresh client and TLS connection
+                await client.aclose()
+                client = make_client()
+
+                if BATCH_MISSED_TICKS:
+                    # Put the messages back so they go out with the next tick
+                    unsent[:0] = messages
+
+        next_tick = loop.time()
+
+        while not stop_event.is_set():
+            unsent.append(time_message())
+            if not BATCH_MISSED_TICKS:
+                # Only the latest time is worth sending, so ticks missed while a post
+                # was stuck (e.g. during a network outage) are dropped
+                del unsent[:-1]
+
+            # Send in the background so the request overlaps with the wait, and tick
+            # on a fixed schedule that doesn't drift by the request time. Only one post
+            # is in flight at a time; ticks arriving meanwhile are coalesced into the next one
+            if in_flight is None or in_flight.done():
+                in_flight = asyncio.create_task(deliver(unsent[:]))
+                unsent.clear()
+
+            # loop.time() is monotonic, so wall clock changes don't shift the schedule. If the
+            # next deadline has already passed (e.g. the process was suspended), snap forward
+            # rather than firing a burst of back-to-back ticks to catch up
+            next_tick += INTERVAL_SECONDS
+            now = loop.time()
+            if next_tick <= now:
+                next_tick = now + INTERVAL_SECONDS
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=max(0, next_tick - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+
+        if in_flight is not None and not in_flight.done():
+            # Give the post in progress a moment to finish, but don't wait out its whole
+            # retry schedule
+            await asyncio.wait([in_flight], timeout=SHUTDOWN_GRACE_SECONDS)
+            in_flight.cancel()
+            await asyncio.gather(in_flight, return_exceptions=True)
+    finally:
+        await client.aclose()
+
+    print("\n\nStopping time notifier...")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if uringcore is not None and sys.platform == "linux":
+        # io_uring-backed event loop, batching the timer and socket syscalls
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    asyncio.run(main())